@@ -1,6 +1,9 @@
 # Fuzzy Set Operations Implementation
 # Example: Customer Satisfaction at Two Restaurants (A and B)
 
+import weakref
+import numpy as np
+
 # Define fuzzy sets (Customer Satisfaction levels)
 A = {'C1': 0.2, 'C2': 0.5, 'C3': 0.8, 'C4': 1.0}
 B = {'C1': 0.4, 'C2': 0.7, 'C3': 0.6, 'C4': 0.9}
@@ -30,22 +33,146 @@ def fuzzy_sum(A, B):
 def fuzzy_cartesian_product(A, B):
     return {(x, y): round(min(A[x], B[y]), 2) for x in A for y in B}
 
-# Perform operations
-union_AB = fuzzy_union(A, B)
-intersection_AB = fuzzy_intersection(A, B)
-complement_A = fuzzy_complement(A)
-difference_AB = fuzzy_difference(A, B)
-sum_AB = fuzzy_sum(A, B) 
-cartesian_AB = fuzzy_cartesian_product(A, B)
-
-# Display results
-print("Fuzzy Set A (Restaurant A):", A)
-print("Fuzzy Set B (Restaurant B):", B)
-print("\nUnion (A ∪ B):", union_AB)
-print("\nIntersection (A ∩ B):", intersection_AB)
-print("\nComplement (A'):", complement_A)
-print("\nDifference (A - B):", difference_AB)
-print("\nAlgebraic Sum A(x)+B(x):", sum_AB)
-print("\nCartesian Product (A × B):")
-for pair, value in cartesian_AB.items():
-    print(f"{pair}: {value}")
+# ---------------------------------------------------------------
+# Array-backed fuzzy sets
+# Memberships live in one contiguous float array aligned to a shared
+# Universe, so every operation is a single vectorized NumPy call.
+# ---------------------------------------------------------------
+
+# Universe: ordered element labels shared by many fuzzy sets
+class Universe:
+    def __init__(self, labels):
+        self.labels = np.asarray(labels)
+        self._positions = None
+        # Keyed weakly, so a universe's cached alignments (and the merged
+        # universes in them) go away with the universe they were made for
+        self._aligned = weakref.WeakKeyDictionary()
+
+    def __len__(self):
+        return len(self.labels)
+
+    # Position of a single label (the lookup dict is built on first use)
+    def position(self, label):
+        if self._positions is None:
+            self._positions = {x: i for i, x in enumerate(self.labels.tolist())}
+        return self._positions[label]
+
+    # Merged universe (self's labels first, then new labels of other) and the
+    # positions of both universes inside it; cached per pair of universes
+    def align(self, other):
+        if other is self:
+            return self, None, None
+        if other not in self._aligned:
+            if len(self) == len(other) and np.array_equal(self.labels, other.labels):
+                self._aligned[other] = (self, None, None)
+            else:
+                labels = np.concatenate((self.labels, other.labels))
+                unique, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+                order = np.argsort(first)
+                rank = np.empty_like(order)
+                rank[order] = np.arange(len(order))
+                positions = rank[inverse]
+                merged = Universe(unique[order])
+                self._aligned[other] = (merged, positions[:len(self)], positions[len(self):])
+        return self._aligned[other]
+
+# dtype=None keeps the dtype of floating-point memberships (float64 otherwise),
+# so the results of operations on float32 sets stay float32
+class FuzzySet:
+    def __init__(self, universe, memberships, dtype=None):
+        if not isinstance(universe, Universe):
+            universe = Universe(universe)
+        self.universe = universe
+        self.memberships = np.ascontiguousarray(memberships, dtype=dtype)
+        if dtype is None and not np.issubdtype(self.memberships.dtype, np.floating):
+            self.memberships = self.memberships.astype(np.float64)
+        if self.memberships.shape != (len(universe),):
+            raise ValueError("memberships must have one value per element of the universe")
+
+    @classmethod
+    def from_dict(cls, memberships, universe=None):
+        if universe is None:
+            universe = Universe(list(memberships))
+        values = np.zeros(len(universe))
+        for x, mu in memberships.items():
+            values[universe.position(x)] = mu
+        return cls(universe, values)
+
+    def to_dict(self, decimals=None):
+        values = self.memberships if decimals is None else np.round(self.memberships, decimals)
+        return dict(zip(self.universe.labels.tolist(), values.tolist()))
+
+    def __len__(self):
+        return len(self.memberships)
+
+    def __getitem__(self, label):
+        return self.memberships[self.universe.position(label)]
+
+    def __repr__(self):
+        return f"FuzzySet({len(self)} elements)"
+
+    # Memberships of both sets on a common universe (elements missing from a set have membership 0)
+    def aligned_with(self, other):
+        universe, own, theirs = self.universe.align(other.universe)
+        if own is None:
+            return universe, self.memberships, other.memberships
+        a = np.zeros(len(universe), dtype=self.memberships.dtype)
+        b = np.zeros(len(universe), dtype=other.memberships.dtype)
+        a[own] = self.memberships
+        b[theirs] = other.memberships
+        return universe, a, b
+
+    # Fuzzy Union (A ∪ B) - max of memberships
+    def union(self, other):
+        universe, a, b = self.aligned_with(other)
+        return FuzzySet(universe, np.maximum(a, b))
+
+    # Fuzzy Intersection (A ∩ B) - min of memberships
+    def intersection(self, other):
+        universe, a, b = self.aligned_with(other)
+        return FuzzySet(universe, np.minimum(a, b))
+
+    # Fuzzy Complement (A') - 1 - membership
+    def complement(self):
+        return FuzzySet(self.universe, 1 - self.memberships)
+
+    # Fuzzy Difference (A - B) - min(A(x), 1 - B(x))
+    def difference(self, other):
+        universe, a, b = self.aligned_with(other)
+        return FuzzySet(universe, np.minimum(a, 1 - b))
+
+    # Fuzzy algebraic sum (A ⊕ B) - A(x) + B(x) - A(x)*B(x)
+    def algebraic_sum(self, other):
+        universe, a, b = self.aligned_with(other)
+        return FuzzySet(universe, a + b - a * b)
+
+    # Fuzzy Cartesian Product (A × B) - matrix of min(A(x), B(y))
+    def cartesian_product(self, other):
+        return np.minimum.outer(self.memberships, other.memberships)
+
+    __or__ = union
+    __and__ = intersection
+    __invert__ = complement
+    __sub__ = difference
+
+
+if __name__ == "__main__":
+    # Perform operations
+    union_AB = fuzzy_union(A, B)
+    intersection_AB = fuzzy_intersection(A, B)
+    complement_A = fuzzy_complement(A)
+    difference_AB = fuzzy_difference(A, B)
+    sum_AB = fuzzy_sum(A, B) 
+    cartesian_AB = fuzzy_cartesian_product(A, B)
+
+    # Display results
+    print("Fuzzy Set A (Restaurant A):", A)
+    print("Fuzzy Set B (Restaurant B):", B)
+    print("\nUnion (A ∪ B):", union_AB)
+    print("\nIntersection (A ∩ B):", intersection_AB)
+    print("\nComplement (A'):", complement_A)
+    print("\nDifference (A - B):", difference_AB)
+    print("\nAlgebraic Sum A(x)+B(x):", sum_AB)
+    print("\nCartesian Product (A × B):")
+    for pair, value in cartesian_AB.items():
+        print(f"{pair}: {value}")
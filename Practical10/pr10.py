@@ -6,54 +6,546 @@ def fitness_function(x):
     # Example: Minimize f(x) = x^2 + 5*sin(x)
     return x**2 + 5 * np.sin(x)
 
-# --- PSO Parameters ---
-num_particles = 30
-max_iter = 100
-w = 0.7        # inertia weight
-c1 = 1.5       # cognitive coefficient
-c2 = 1.5       # social coefficient
-
-# --- Initialize particles ---
-x = np.random.uniform(-10, 10, num_particles)   # position
-v = np.random.uniform(-1, 1, num_particles)     # velocity
-pbest = x.copy()
-pbest_fitness = fitness_function(x)
-gbest_index = np.argmin(pbest_fitness)
-gbest = pbest[gbest_index]
-
-# --- PSO Iterations ---
-convergence_curve = []
-
-for t in range(max_iter):
-    for i in range(num_particles):
-        r1, r2 = np.random.rand(), np.random.rand()
-
-        # Update velocity
-        v[i] = (w * v[i]) + (c1 * r1 * (pbest[i] - x[i])) + (c2 * r2 * (gbest - x[i]))
-
-        # Update position
-        x[i] = x[i] + v[i]
-
-        # Evaluate fitness
-        fitness = fitness_function(x[i])
-
-        # Update personal best
-        if fitness < pbest_fitness[i]:
-            pbest[i] = x[i]
-            pbest_fitness[i] = fitness
-
-    # Update global best
+# --- Separable N-dimensional version: sum of fitness_function over dimensions ---
+def batch_fitness(positions):
+    return np.sum(fitness_function(positions), axis=1)
+
+# --- Neighbourhood topologies ---
+# informants(positions) returns an (n, k) array with the indices each particle
+# listens to (itself included); its local best is then one vectorized gather.
+
+def local_best(informants, pbest_fitness):
+    best = np.argmin(pbest_fitness[informants], axis=1)
+    return informants[np.arange(len(informants)), best]
+
+class RingTopology:
+    # Particle i is informed by i-k .. i+k (indices wrap around)
+    def __init__(self, k=1):
+        self.k = k
+        self.neighbors = None
+
+    def informants(self, positions):
+        n = len(positions)
+        if self.neighbors is None or len(self.neighbors) != n:
+            self.neighbors = (np.arange(n)[:, None] + np.arange(-self.k, self.k + 1)) % n
+        return self.neighbors
+
+class VonNeumannTopology:
+    # Particles sit on a wrapped 2-D grid and listen to themselves + N, S, E, W
+    def __init__(self):
+        self.neighbors = None
+
+    def informants(self, positions):
+        n = len(positions)
+        if self.neighbors is None or len(self.neighbors) != n:
+            cols = int(np.ceil(n / max(int(np.sqrt(n)), 1)))
+            rows = int(np.ceil(n / cols))
+            r, c = np.divmod(np.arange(n), cols)
+            moves = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]
+            self.neighbors = np.stack([(((r + dr) % rows) * cols + (c + dc) % cols) % n for dr, dc in moves], axis=1)
+        return self.neighbors
+
+class RandomTopology:
+    # Every particle listens to itself and k random others, re-drawn every `period` iterations
+    # (rng=None: a ParticleSwarm shares its own generator with the topology)
+    def __init__(self, k=3, period=10, rng=None):
+        self.k, self.period = k, period
+        self.rng = rng
+        self.calls = 0
+        self.neighbors = None
+
+    def informants(self, positions):
+        n = len(positions)
+        if self.neighbors is None or len(self.neighbors) != n or self.calls % self.period == 0:
+            self.rng = np.random.default_rng(self.rng)
+            self.neighbors = np.concatenate((np.arange(n)[:, None], self.rng.integers(0, n, (n, self.k))), axis=1)
+        self.calls += 1
+        return self.neighbors
+
+class KDTree:
+    """
+    Balanced k-d tree over the first few coordinates of a set of points,
+    stored implicitly: `perm` orders the points so that node i of level L
+    covers perm[ranges(L)[i]:ranges(L)[i + 1]], and lo / hi hold the
+    bounding box of every node in heap order (children of j are 2j+1, 2j+2).
+
+    update() keeps the permutation and only refits the boxes to the new
+    positions (O(n * depth)), which keeps queries exact. The tree is rebuilt
+    with median splits along each node's widest axis once, on average, the
+    two children of a node overlap by more than `max_overlap` of the
+    node's extent along its split axis (a fresh tree has no overlap), as
+    overlapping boxes are what make queries visit extra leaves.
+    """
+
+    def __init__(self, leaf_size=16, max_overlap=0.1):
+        self.leaf_size = leaf_size
+        self.max_overlap = max_overlap
+        self.perm = None
+
+    def ranges(self, level):
+        return np.arange(2 ** level + 1) * len(self.perm) // 2 ** level
+
+    def build(self, points):
+        n = len(points)
+        self.depth = int(np.ceil(np.log2(n / self.leaf_size))) if n > self.leaf_size else 0
+        self.perm = np.arange(n)
+        split_axes = []
+        for level in range(self.depth):
+            starts = self.ranges(level)
+            node = np.repeat(np.arange(2 ** level), np.diff(starts))
+            sorted_points = points[self.perm]
+            spread = np.maximum.reduceat(sorted_points, starts[:-1]) - np.minimum.reduceat(sorted_points, starts[:-1])
+            split_axes.append(np.argmax(spread, axis=1))
+            self.perm = self.perm[np.lexsort((sorted_points[np.arange(n), split_axes[-1][node]], node))]
+        self.split_axis = np.concatenate(split_axes) if split_axes else np.zeros(0, dtype=np.intp)
+        self.refit(points)
+
+    def refit(self, points):
+        sorted_points = points[self.perm]
+        leaves = self.ranges(self.depth)[:-1]
+        lo, hi = [np.minimum.reduceat(sorted_points, leaves)], [np.maximum.reduceat(sorted_points, leaves)]
+        for _ in range(self.depth):
+            lo.append(np.minimum(lo[-1][0::2], lo[-1][1::2]))
+            hi.append(np.maximum(hi[-1][0::2], hi[-1][1::2]))
+        self.lo, self.hi = np.concatenate(lo[::-1]), np.concatenate(hi[::-1])
+
+    def overlap(self):
+        """Mean overlap of sibling boxes along their parent's split axis, relative to the parent's extent."""
+        parents = np.arange(len(self.split_axis))
+        if not parents.size:
+            return 0.0
+        axis = self.split_axis
+        left, right = 2 * parents + 1, 2 * parents + 2
+        shared = (np.minimum(self.hi[left, axis], self.hi[right, axis])
+                  - np.maximum(self.lo[left, axis], self.lo[right, axis]))
+        extent = self.hi[parents, axis] - self.lo[parents, axis]
+        return np.mean(np.maximum(shared, 0) / np.maximum(extent, 1e-300))
+
+    def update(self, points):
+        if self.perm is None or len(self.perm) != len(points):
+            return self.build(points)
+        self.refit(points)
+        if self.overlap() > self.max_overlap:
+            self.build(points)
+
+    def nearest(self, positions, k, max_pairs):
+        """
+        Exact k nearest other points of every point (closest first, padded
+        with the point itself when there are fewer than k others).
+
+        Each point first takes the k nearest in its own leaf, then walks
+        the tree level by level, keeping only nodes whose box is closer
+        than that k-th distance, and merges the leaves it reaches. The box
+        distance only uses the indexed coordinates, so it never exceeds the
+        full distance and the result is exact over all dimensions of
+        positions. A point whose walk keeps more nodes than comparing it
+        with every point would cost (when the indexed coordinates separate
+        the points poorly) is compared with every point instead. Both steps
+        work in blocks of about max_pairs elements.
+        """
+        n = len(positions)
+        points = positions[:, :self.lo.shape[1]]
+        starts = self.ranges(self.depth)
+        first_leaf = 2 ** self.depth - 1
+        leaf_of = np.empty(n, dtype=np.intp)
+        leaf_of[self.perm] = np.repeat(np.arange(2 ** self.depth), np.diff(starts))
+        best = np.tile(np.arange(n)[:, None], (1, k))
+        best_d2 = np.full((n, k), np.inf)
+        max_nodes = max(4, n // (8 * self.leaf_size))
+        scan = []
+
+        rows_per_block = max(1, max_pairs // (max_nodes * positions.shape[1]))
+        for lo in range(0, n, rows_per_block):
+            rows = np.arange(lo, min(lo + rows_per_block, n))
+            self.merge_leaves(positions, best, best_d2, rows, leaf_of[rows], starts)
+            query, node, gap2 = rows, np.zeros(len(rows), dtype=np.intp), np.zeros(len(rows))
+            for _ in range(self.depth):
+                query, node = np.repeat(query, 2), (2 * np.repeat(node, 2) + 1) + np.tile([0, 1], len(node))
+                gap = np.maximum(self.lo[node] - points[query], 0) + np.maximum(points[query] - self.hi[node], 0)
+                gap2 = np.einsum("ij,ij->i", gap, gap)
+                near = gap2 < best_d2[query, -1]
+                crowded = np.bincount(query[near], minlength=n) > max_nodes
+                if crowded.any():
+                    scan.append(np.flatnonzero(crowded))
+                    near &= ~crowded[query]
+                query, node, gap2 = query[near], node[near], gap2[near]
+            leaf = node - first_leaf
+            other = leaf != leaf_of[query]
+            query, leaf, gap2 = query[other], leaf[other], gap2[other]
+
+            # The closest leaf of every query first, then the rest that are still close enough
+            order = np.lexsort((gap2, query))
+            closest = np.zeros(query.size, dtype=bool)
+            closest[order[np.unique(query[order], return_index=True)[1]]] = True
+            self.merge_leaves(positions, best, best_d2, query[closest], leaf[closest], starts)
+            rest = ~closest & (gap2 < best_d2[query, -1])
+            self.merge_leaves(positions, best, best_d2, query[rest], leaf[rest], starts)
+
+        scan = np.concatenate(scan) if scan else np.zeros(0, dtype=np.intp)
+        kk = min(k, n - 1)
+        rows_per_block = max(1, max_pairs // (n * positions.shape[1]))
+        for lo in range(0, scan.size, rows_per_block):
+            rows = scan[lo:lo + rows_per_block]
+            d2 = np.sum((positions[None, :, :] - positions[rows, None, :]) ** 2, axis=2)
+            d2[np.arange(rows.size), rows] = np.inf
+            nearest = np.argpartition(d2, kk - 1, axis=1)[:, :kk]
+            order = np.argsort(np.take_along_axis(d2, nearest, axis=1), axis=1)
+            best[rows, :kk] = np.take_along_axis(nearest, order, axis=1)
+        return best
+
+    def merge_leaves(self, positions, best, best_d2, queries, leaves, starts):
+        """Merges the points of one leaf per (query, leaf) pair into the queries' k-best lists."""
+        k = best.shape[1]
+        start, end = starts[leaves], starts[leaves + 1]
+        idx = start[:, None] + np.arange(np.max(end - start, initial=0))
+        found = self.perm[np.minimum(idx, len(self.perm) - 1)]
+        d2 = np.sum((positions[found] - positions[queries, None]) ** 2, axis=2)
+        d2[(idx >= end[:, None]) | (found == queries[:, None])] = np.inf
+
+        # Old lists (once per query) and new points together; the k smallest per query are kept
+        listed = np.unique(queries)
+        query = np.concatenate((np.repeat(listed, k), np.repeat(queries, idx.shape[1])))
+        found = np.concatenate((best[listed].ravel(), found.ravel()))
+        d2 = np.concatenate((best_d2[listed].ravel(), d2.ravel()))
+        order = np.lexsort((d2, query))
+        query, found, d2 = query[order], found[order], d2[order]
+        rank = np.arange(query.size) - np.searchsorted(query, query)
+        keep = rank < k
+        best[query[keep], rank[keep]] = found[keep]
+        best_d2[query[keep], rank[keep]] = d2[keep]
+
+class DynamicKNNTopology:
+    """
+    Each particle listens to itself and its k nearest particles in position space.
+
+    A KDTree over the first index_dims coordinates (default: all) finds
+    the exact k nearest over all dimensions. Its leaves hold k+1 to 2(k+1)
+    particles and follow the swarm's density, so a converged or clustered
+    swarm costs about as much as a spread-out one: roughly
+    O(n log n * dim) per call instead of O(n^2 * dim). In high dimensions
+    (or with few indexed ones) the boxes prune little and the cost rises
+    to that of comparing all pairs, which is what particles that prune
+    badly fall back to. For very large swarms, period > 1 reuses the lists
+    for several iterations (they change slowly).
+    """
+
+    def __init__(self, k=5, index_dims=None, period=1, block_elements=2**22):
+        self.k = k
+        self.index_dims = index_dims
+        self.period = period
+        self.block_elements = block_elements
+        self.calls = 0
+        self.index = None
+        self.neighbors = None
+
+    def informants(self, positions):
+        self.calls += 1
+        if self.neighbors is not None and len(self.neighbors) == len(positions) and (self.calls - 1) % self.period:
+            return self.neighbors
+
+        n, dim = positions.shape
+        m = min(self.index_dims or dim, dim)
+        if self.index is None:
+            self.index = KDTree(leaf_size=2 * (self.k + 1))
+        self.index.update(positions[:, :m])
+        nearest = self.index.nearest(positions, self.k, self.block_elements)
+        self.neighbors = np.concatenate((np.arange(n)[:, None], nearest), axis=1)
+        return self.neighbors
+
+# --- Vectorized PSO engine ---
+class ParticleSwarm:
+    """
+    PSO on (num_particles, dim) arrays.
+
+    objective(positions) must score a whole (n, dim) array and return (n,).
+    mode="sync":  the swarm moves as one array per iteration and gbest is
+                  updated once per iteration (one objective call per iteration).
+    mode="async": particles move one after another and gbest is updated after
+                  every particle, so later particles already follow it.
+    bounds="clip" stops particles at the boundary (and zeroes that velocity
+    component); bounds="reflect" mirrors them back and reverses the velocity.
+    v_max clamps every velocity component to [-v_max, v_max].
+    topology=None follows the global best; a topology object (RingTopology,
+    VonNeumannTopology, RandomTopology, DynamicKNNTopology) makes every
+    particle follow the best pbest among its informants instead.
+    rng is a numpy Generator (or a seed) used for every random draw.
+    """
+
+    def __init__(self, objective, dim=1, num_particles=30, w=0.7, c1=1.5, c2=1.5,
+                 lb=-10, ub=10, v_max=None, bounds="clip", mode="sync", topology=None, rng=None):
+        self.objective = objective
+        self.dim, self.num_particles = dim, num_particles
+        self.w, self.c1, self.c2 = w, c1, c2
+        self.lb, self.ub = lb, ub
+        self.v_max = v_max
+        self.bounds = bounds
+        self.mode = mode
+        self.topology = topology
+        self.rng = np.random.default_rng(rng)
+        if isinstance(topology, RandomTopology) and topology.rng is None:
+            topology.rng = self.rng
+
+        self.x = self.rng.uniform(lb, ub, self.swarm_shape())
+        self.v = self.rng.uniform(-1, 1, self.swarm_shape())
+        self.clamp_velocity(self.v)
+        self.pbest = self.x.copy()
+        self.evaluations = 0
+        self.pbest_fitness = self.evaluate(self.x)
+        self.init_gbest()
+
+    # Hooks that ReplicaSwarm overrides for its (n_replicas, num_particles, dim) layout
+    def swarm_shape(self):
+        return (self.num_particles, self.dim)
+
+    def init_gbest(self):
+        gbest_index = np.argmin(self.pbest_fitness)
+        self.gbest = self.pbest[gbest_index].copy()
+        self.gbest_fitness = self.pbest_fitness[gbest_index]
+
+    def observation(self):
+        # (best, population, fitness) passed to telemetry.observe()
+        return self.gbest_fitness, self.x, self.pbest_fitness
+
+    def evaluate(self, positions):
+        self.evaluations += len(positions)
+        return np.asarray(self.objective(positions), dtype=float).reshape(len(positions))
+
+    def clamp_velocity(self, v):
+        if self.v_max is not None:
+            np.clip(v, -self.v_max, self.v_max, out=v)
+
+    def apply_bounds(self, x, v):
+        if self.bounds == "clip":
+            outside = (x < self.lb) | (x > self.ub)
+            np.clip(x, self.lb, self.ub, out=x)
+            v[outside] = 0.0
+        elif self.bounds == "reflect":
+            below, above = x < self.lb, x > self.ub
+            x[below] = 2 * self.lb - x[below]
+            x[above] = 2 * self.ub - x[above]
+            v[below | above] *= -1
+            np.clip(x, self.lb, self.ub, out=x)  # in case a step overshoots by more than the range
+        elif self.bounds is not None:
+            raise ValueError(f"Unknown bound handling: {self.bounds!r}")
+
+    def move(self, x, v, pbest, leaders):
+        # v = w*v + c1*r1*(pbest - x) + c2*r2*(leader - x), updated in place
+        r1 = self.rng.random(x.shape)
+        r2 = self.rng.random(x.shape)
+        v *= self.w
+        r1 *= self.c1
+        r1 *= pbest - x
+        v += r1
+        r2 *= self.c2
+        r2 *= leaders - x
+        v += r2
+        self.clamp_velocity(v)
+        x += v
+        self.apply_bounds(x, v)
+
+    def step(self):
+        if self.mode == "sync":
+            if self.topology is None:
+                leaders = self.gbest
+            else:
+                leaders = self.pbest[local_best(self.topology.informants(self.x), self.pbest_fitness)]
+            self.move(self.x, self.v, self.pbest, leaders)
+            fitness = self.evaluate(self.x)
+            improved = fitness < self.pbest_fitness
+            self.pbest[improved] = self.x[improved]
+            self.pbest_fitness[improved] = fitness[improved]
+            best = np.argmin(self.pbest_fitness)
+            if self.pbest_fitness[best] < self.gbest_fitness:
+                self.gbest = self.pbest[best].copy()
+                self.gbest_fitness = self.pbest_fitness[best]
+        elif self.mode == "async":
+            informants = None if self.topology is None else self.topology.informants(self.x)
+            for i in range(self.num_particles):
+                x, v = self.x[i:i + 1], self.v[i:i + 1]
+                if informants is None:
+                    leader = self.gbest
+                else:
+                    leader = self.pbest[informants[i][np.argmin(self.pbest_fitness[informants[i]])]]
+                self.move(x, v, self.pbest[i:i + 1], leader)
+                fitness = self.evaluate(x)[0]
+                if fitness < self.pbest_fitness[i]:
+                    self.pbest[i] = x[0]
+                    self.pbest_fitness[i] = fitness
+                    if fitness < self.gbest_fitness:
+                        self.gbest = x[0].copy()
+                        self.gbest_fitness = fitness
+        else:
+            raise ValueError(f"Unknown update mode: {self.mode!r}")
+
+    def state(self):
+        """Arrays and scalars that fully describe the swarm (and its topology), for checkpoints."""
+        state = {"x": self.x, "v": self.v, "pbest": self.pbest, "pbest_fitness": self.pbest_fitness,
+                 "gbest": self.gbest, "gbest_fitness": self.gbest_fitness, "evaluations": self.evaluations}
+        if self.topology is not None:
+            for name, value in vars(self.topology).items():
+                fields = vars(value).items() if isinstance(value, KDTree) else [(None, value)]
+                for field, v in fields:
+                    # A generator's state is saved by the checkpoint itself
+                    if v is not None and not isinstance(v, np.random.Generator):
+                        state["topology." + name + ("." + field if field else "")] = v
+        return state
+
+    def load_state(self, state):
+        for name in ("x", "v", "pbest", "pbest_fitness", "gbest"):
+            setattr(self, name, np.array(state[name]))
+        self.gbest_fitness, self.evaluations = state["gbest_fitness"], state["evaluations"]
+        for key, value in state.items():
+            if not key.startswith("topology."):
+                continue
+            value = np.array(value) if isinstance(value, np.ndarray) else value
+            name, _, field = key[len("topology."):].partition(".")
+            if field:
+                if not isinstance(getattr(self.topology, name, None), KDTree):
+                    setattr(self.topology, name, KDTree(state[f"topology.{name}.leaf_size"]))
+                setattr(getattr(self.topology, name), field, value)
+            else:
+                setattr(self.topology, name, value)
+
+    def optimize(self, max_iter=100, telemetry=None, checkpoint=None, resume=None, termination=None):
+        """
+        Runs until iteration max_iter, or until termination (a
+        common.termination.Termination) stops it; the convergence curve then
+        ends at that iteration. checkpoint.save() gets the swarm state after
+        every iteration; resume (a state dict from
+        checkpoint.load(rng=swarm.rng)) continues a checkpointed run.
+        """
+        convergence_curve = np.empty((max_iter,) + np.shape(self.gbest_fitness))
+        if termination is not None:
+            termination.reset()
+        start = 0
+        if resume is not None:
+            self.load_state(resume)
+            start = resume["iteration"]
+            convergence_curve[:start] = resume["convergence_curve"]
+        for t in range(start, max_iter):
+            self.step()
+            convergence_curve[t] = self.gbest_fitness
+            if telemetry is not None:
+                telemetry.observe(t, *self.observation(), self.evaluations)
+            if checkpoint is not None:
+                checkpoint.save(t + 1, {**self.state(), "convergence_curve": convergence_curve[:t + 1]}, self.rng)
+            if termination is not None and termination.update(t, self.gbest_fitness, self.x, self.evaluations):
+                convergence_curve = convergence_curve[:t + 1]
+                break
+        return self.gbest, self.gbest_fitness, convergence_curve
+
+class ReplicaSwarm(ParticleSwarm):
+    """
+    n_replicas independent global-best swarms advanced together.
+
+    Positions, velocities and personal bests are (n_replicas, num_particles,
+    dim) arrays and every replica keeps its own gbest, so one vectorized step
+    moves all of them; objective(positions) must return (n_replicas,
+    num_particles). Velocity clamping and bound handling are those of
+    ParticleSwarm (synchronous updates, no topology). evaluations counts the
+    objective calls of one replica.
+    """
+
+    def __init__(self, objective, n_replicas=100, dim=1, num_particles=30, w=0.7, c1=1.5, c2=1.5,
+                 lb=-10, ub=10, v_max=None, bounds="clip", rng=None):
+        self.n_replicas = n_replicas
+        self.replicas = np.arange(n_replicas)
+        super().__init__(objective, dim, num_particles, w, c1, c2, lb, ub, v_max, bounds, "sync", None, rng)
+
+    def swarm_shape(self):
+        return (self.n_replicas, self.num_particles, self.dim)
+
+    def init_gbest(self):
+        gbest_index = np.argmin(self.pbest_fitness, axis=1)
+        self.gbest = self.pbest[self.replicas, gbest_index]
+        self.gbest_fitness = self.pbest_fitness[self.replicas, gbest_index]
+
+    def observation(self):
+        # Telemetry sees the best replica, and the mean of the per-replica bests
+        return self.gbest_fitness.min(), None, self.gbest_fitness
+
+    def load_state(self, state):
+        super().load_state(state)
+        self.gbest_fitness = np.array(self.gbest_fitness)   # per replica, updated in place
+
+    def evaluate(self, positions):
+        self.evaluations += positions.shape[1]
+        return np.asarray(self.objective(positions), dtype=float).reshape(positions.shape[:2])
+
+    def step(self):
+        self.move(self.x, self.v, self.pbest, self.gbest[:, None])
+        fitness = self.evaluate(self.x)
+        improved = fitness < self.pbest_fitness
+        self.pbest[improved] = self.x[improved]
+        self.pbest_fitness[improved] = fitness[improved]
+        best = np.argmin(self.pbest_fitness, axis=1)
+        best_fitness = self.pbest_fitness[self.replicas, best]
+        better = best_fitness < self.gbest_fitness
+        self.gbest[better] = self.pbest[self.replicas[better], best[better]]
+        self.gbest_fitness[better] = best_fitness[better]
+
+    def optimize(self, max_iter=100, telemetry=None, checkpoint=None, resume=None, termination=None):
+        """
+        ParticleSwarm.optimize for all replicas; returns per-replica
+        (gbest (R, dim), gbest_fitness (R,), convergence (R, max_iter)).
+        All replicas run for max_iter iterations, so termination is not supported.
+        """
+        if termination is not None:
+            raise ValueError("ReplicaSwarm runs every replica for max_iter iterations; termination is not supported")
+        gbest, gbest_fitness, convergence = super().optimize(max_iter, telemetry, checkpoint, resume)
+        return gbest.copy(), gbest_fitness.copy(), convergence.T
+
+if __name__ == "__main__":
+    # --- PSO Parameters ---
+    num_particles = 30
+    max_iter = 100
+    w = 0.7        # inertia weight
+    c1 = 1.5       # cognitive coefficient
+    c2 = 1.5       # social coefficient
+
+    # --- Initialize particles ---
+    rng = np.random.default_rng()
+    x = rng.uniform(-10, 10, num_particles)   # position
+    v = rng.uniform(-1, 1, num_particles)     # velocity
+    pbest = x.copy()
+    pbest_fitness = fitness_function(x)
     gbest_index = np.argmin(pbest_fitness)
     gbest = pbest[gbest_index]
-    convergence_curve.append(fitness_function(gbest))
-
-# --- Results ---
-print("Optimal x:", gbest)
-print("Optimal fitness value:", fitness_function(gbest))
-
-# --- Plot Convergence ---
-plt.plot(convergence_curve)
-plt.title("PSO Convergence Curve")
-plt.xlabel("Iteration")
-plt.ylabel("Best Fitness Value")
-plt.show()
+
+    # --- PSO Iterations ---
+    convergence_curve = np.empty(max_iter)
+
+    for t in range(max_iter):
+        r = rng.random((num_particles, 2))  # (r1, r2) of every particle, drawn in one block
+        for i in range(num_particles):
+            r1, r2 = r[i]
+
+            # Update velocity
+            v[i] = (w * v[i]) + (c1 * r1 * (pbest[i] - x[i])) + (c2 * r2 * (gbest - x[i]))
+
+            # Update position
+            x[i] = x[i] + v[i]
+
+            # Evaluate fitness
+            fitness = fitness_function(x[i])
+
+            # Update personal best
+            if fitness < pbest_fitness[i]:
+                pbest[i] = x[i]
+                pbest_fitness[i] = fitness
+
+        # Update global best
+        gbest_index = np.argmin(pbest_fitness)
+        gbest = pbest[gbest_index]
+        convergence_curve[t] = pbest_fitness[gbest_index]
+
+    # --- Results ---
+    print("Optimal x:", gbest)
+    print("Optimal fitness value:", pbest_fitness[gbest_index])
+
+    # --- Plot Convergence ---
+    plt.plot(convergence_curve)
+    plt.title("PSO Convergence Curve")
+    plt.xlabel("Iteration")
+    plt.ylabel("Best Fitness Value")
+    plt.show()
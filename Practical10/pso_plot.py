@@ -1,48 +1,111 @@
+import os
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+try:
+    from pr10 import DynamicKNNTopology, local_best
+except ImportError:  # imported as Practical10.pso_plot from the repository root
+    from Practical10.pr10 import DynamicKNNTopology, local_best
+
 # --- Parameters ---
 num_particles = 30
 w, c1, c2, c3 = 0.6, 1.5, 1.5, 1.2
 goal = np.array([5, 5])      # Target position
 bounds = [-10, 10]
 
-# --- Initialize particles ---
-positions = np.random.uniform(bounds[0], bounds[1], (num_particles, 2))
-velocities = np.random.uniform(-1, 1, (num_particles, 2))
-pbest = positions.copy()
-gbest = np.mean(pbest, axis=0)
-
-# --- Plot setup ---
-fig, ax = plt.subplots()
-scat = ax.scatter(positions[:, 0], positions[:, 1], color='blue')
-goal_dot, = ax.plot(goal[0], goal[1], 'ro', markersize=8, label='Goal')
-ax.set_xlim(bounds)
-ax.set_ylim(bounds)
-ax.set_title("Goal-Directed Particle Swarm")
-ax.legend()
-
-# --- Update Function ---
-def update(frame):
-    global positions, velocities, pbest, gbest
-    for i in range(num_particles):
-        r1, r2, r3 = np.random.rand(), np.random.rand(), np.random.rand()
-        velocities[i] = (w * velocities[i] +
-                         c1 * r1 * (pbest[i] - positions[i]) +
-                         c2 * r2 * (gbest - positions[i]) +
-                         c3 * r3 * (goal - positions[i]))
-        positions[i] += velocities[i]
+# --- Goal-directed swarm (no plotting, so it can run headless) ---
+class GoalSwarm:
+    def __init__(self, num_particles=num_particles, goal=goal, bounds=bounds, topology=None, rng=None):
+        self.goal = np.asarray(goal, dtype=float)
+        self.bounds = bounds
+        self.rng = np.random.default_rng(rng)
+        self.positions = self.rng.uniform(bounds[0], bounds[1], (num_particles, 2))
+        self.velocities = self.rng.uniform(-1, 1, (num_particles, 2))
+        self.pbest = self.positions.copy()
+        self.pbest_dist = np.linalg.norm(self.goal - self.pbest, axis=1)   # only refreshed for particles that improve
+        # Each particle follows the best of its k nearest neighbours instead of one global best
+        self.topology = topology or DynamicKNNTopology(k=5)
+        self.lbest = self.pbest[local_best(self.topology.informants(self.positions), self.pbest_dist)]
+        self.iteration = 0
+
+    def step(self):
+        x, v = self.positions, self.velocities
+        r1, r2, r3 = self.rng.random((3, len(x), 1))
+        v *= w
+        v += c1 * r1 * (self.pbest - x)
+        v += c2 * r2 * (self.lbest - x)
+        v += c3 * r3 * (self.goal - x)
+        x += v
         # Keep within bounds
-        positions[i] = np.clip(positions[i], bounds[0], bounds[1])
-        # Update personal best
-        if np.linalg.norm(goal - positions[i]) < np.linalg.norm(goal - pbest[i]):
-            pbest[i] = positions[i]
-    gbest = pbest[np.argmin(np.linalg.norm(pbest - goal, axis=1))]
-    scat.set_offsets(positions)
-    ax.set_title(f"Iteration: {frame}")
-    return scat,
-
-# --- Animate ---
-ani = FuncAnimation(fig, update, frames=100, interval=100, repeat=False)
-plt.show()
+        np.clip(x, self.bounds[0], self.bounds[1], out=x)
+        # Update personal bests
+        dist = np.linalg.norm(self.goal - x, axis=1)
+        improved = dist < self.pbest_dist
+        self.pbest[improved] = x[improved]
+        self.pbest_dist[improved] = dist[improved]
+        self.lbest = self.pbest[local_best(self.topology.informants(x), self.pbest_dist)]
+        self.iteration += 1
+
+# --- Headless recording ---
+def record(path, swarm, iterations, decimate=1, dtype=np.float32):
+    """
+    Runs the swarm at full speed and streams positions into a .npy file.
+
+    The file is preallocated with shape (frames, num_particles, 2) and
+    written through a memory map, so runs far larger than RAM only keep the
+    current frame in memory. Frame 0 is the initial swarm; after that every
+    `decimate`-th iteration is stored. Returns the path.
+    """
+    frames = iterations // decimate + 1
+    trajectory = np.lib.format.open_memmap(path, mode="w+", dtype=dtype,
+                                           shape=(frames, len(swarm.positions), 2))
+    trajectory[0] = swarm.positions
+    for it in range(1, iterations + 1):
+        swarm.step()
+        if it % decimate == 0:
+            trajectory[it // decimate] = swarm.positions
+    trajectory.flush()
+    del trajectory
+    return path
+
+# --- Offline replay ---
+def replay(path, interval=50, stride=1, goal=goal, bounds=bounds, max_points=None):
+    """
+    Animates a recorded trajectory with blitting (only the particles and the
+    frame counter are redrawn). The file is opened memory-mapped, so frames
+    are read from disk as they are shown; stride skips frames and max_points
+    draws only the first particles of very large swarms.
+    """
+    trajectory = np.load(path, mmap_mode="r")
+    shown = slice(None, max_points)
+
+    fig, ax = plt.subplots()
+    scat = ax.scatter(trajectory[0, shown, 0], trajectory[0, shown, 1], color='blue', s=8)
+    ax.plot(goal[0], goal[1], 'ro', markersize=8, label='Goal')
+    ax.set_xlim(bounds)
+    ax.set_ylim(bounds)
+    ax.set_title("Goal-Directed Particle Swarm")
+    ax.legend(loc="upper left")
+    # The title is outside the blitted area, so the counter is an axes text artist
+    label = ax.text(0.98, 0.02, "", transform=ax.transAxes, ha="right")
+
+    def draw(frame):
+        scat.set_offsets(trajectory[frame, shown])
+        label.set_text(f"Frame: {frame}")
+        return scat, label
+
+    ani = FuncAnimation(fig, draw, frames=range(0, len(trajectory), stride),
+                        interval=interval, blit=True, repeat=False)
+    return fig, ani
+
+
+if __name__ == "__main__":
+    # Record 100 iterations, then replay them. Large headless runs work the same way, e.g.
+    #   record("big.npy", GoalSwarm(10_000, topology=DynamicKNNTopology(k=5, period=10)), 10_000, decimate=10)
+    # The demo recording goes to a temporary directory, removed once the window closes
+    with tempfile.TemporaryDirectory() as tmp:
+        path = record(os.path.join(tmp, "pso_trajectory.npy"), GoalSwarm(num_particles), iterations=100)
+        fig, ani = replay(path, interval=100)
+        plt.show()
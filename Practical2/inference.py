@@ -0,0 +1,162 @@
+import time
+import numpy as np
+from mem import TriangularMF, TrapezoidalMF, GaussianMF
+
+# --- Batched fuzzy inference (Mamdani and Sugeno) ---
+# Every stage works on a whole batch of crisp inputs at once:
+#   fuzzify (B,) -> fire rules (B, rules) -> aggregate (B, universe) -> defuzzify (B,)
+
+TNORMS = {"min": np.minimum, "product": np.multiply}
+SNORMS = {"max": np.maximum, "probor": lambda a, b: a + b - a * b}
+
+class Rule:
+    # IF var1 is term1 AND/OR var2 is term2 ... THEN consequent
+    # consequent: an output term name (Mamdani) or {"const": c, var: coef, ...} (Sugeno)
+    def __init__(self, antecedents, consequent, connective="and"):
+        self.antecedents = antecedents
+        self.consequent = consequent
+        self.connective = connective
+
+def fire_rules(inputs, variables, rules, and_op="min", or_op="max"):
+    """Firing strength of every rule for every sample, shape (B, n_rules)."""
+    # Fuzzify each (variable, term) pair once, however many rules use it
+    memberships = {}
+    for rule in rules:
+        for var, term in rule.antecedents.items():
+            if (var, term) not in memberships:
+                memberships[var, term] = variables[var][term](inputs[var])
+
+    batch = len(next(iter(memberships.values())))
+    strengths = np.empty((batch, len(rules)))
+    for r, rule in enumerate(rules):
+        op = TNORMS[and_op] if rule.connective == "and" else SNORMS[or_op]
+        degrees = [memberships[var, term] for var, term in rule.antecedents.items()]
+        strength = strengths[:, r]
+        strength[:] = degrees[0]
+        for degree in degrees[1:]:
+            strength[:] = op(strength, degree)
+    return strengths
+
+def defuzzify(aggregated, universe, method="centroid"):
+    """Centroid or bisector of each row of an aggregated (B, len(universe)) output."""
+    total = aggregated.sum(axis=1)
+    if method == "centroid":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (aggregated @ universe) / total
+    if method == "bisector":
+        cumulative = np.cumsum(aggregated, axis=1)
+        idx = np.argmax(cumulative >= 0.5 * total[:, None], axis=1)
+        return np.where(total > 0, universe[idx], np.nan)
+    raise ValueError(f"Unknown defuzzification method: {method!r}")
+
+class MamdaniSystem:
+    """
+    Mamdani controller over a discretized output universe.
+
+    Rules sharing a consequent are merged first (max of their strengths),
+    since max_r min(w_r, μ_t) = min(max_r w_r, μ_t); aggregation is then
+    O(B * terms * universe) and runs in chunks of chunk_size samples so the
+    (chunk, universe) buffer stays small. Samples that fire no rule give nan.
+    """
+
+    def __init__(self, variables, output_universe, output_terms, rules,
+                 and_op="min", or_op="max", implication="min", defuzz="centroid", chunk_size=4096):
+        self.variables = variables
+        self.universe = np.asarray(output_universe, dtype=float)
+        self.term_names = list(output_terms)
+        # Output membership functions are evaluated on the universe only once
+        self.term_values = np.array([output_terms[t](self.universe) for t in self.term_names])
+        self.rules = rules
+        self.and_op, self.or_op = and_op, or_op
+        self.implication = TNORMS[implication]
+        self.defuzz = defuzz
+        self.chunk_size = chunk_size
+        self.rule_terms = np.array([self.term_names.index(rule.consequent) for rule in rules])
+
+    def evaluate(self, inputs):
+        strengths = fire_rules(inputs, self.variables, self.rules, self.and_op, self.or_op)
+        batch = len(strengths)
+
+        # Strength of each output term = max over the rules that conclude it
+        term_strengths = np.zeros((batch, len(self.term_names)))
+        for t in range(len(self.term_names)):
+            rules_t = self.rule_terms == t
+            if rules_t.any():
+                term_strengths[:, t] = strengths[:, rules_t].max(axis=1)
+
+        output = np.empty(batch)
+        aggregated = np.empty((min(self.chunk_size, batch), len(self.universe)))
+        clipped = np.empty_like(aggregated)
+        for lo in range(0, batch, self.chunk_size):
+            hi = min(lo + self.chunk_size, batch)
+            agg, tmp = aggregated[:hi - lo], clipped[:hi - lo]
+            agg.fill(0.0)
+            for t, values in enumerate(self.term_values):
+                self.implication(term_strengths[lo:hi, t, None], values, out=tmp)
+                np.maximum(agg, tmp, out=agg)
+            output[lo:hi] = defuzzify(agg, self.universe, self.defuzz)
+        return output
+
+class SugenoSystem:
+    """
+    First-order Sugeno controller: the output is the strength-weighted
+    average of each rule's linear consequent const + sum(coef * input).
+    """
+
+    def __init__(self, variables, rules, and_op="min", or_op="max"):
+        self.variables = variables
+        self.rules = rules
+        self.and_op, self.or_op = and_op, or_op
+
+    def evaluate(self, inputs):
+        strengths = fire_rules(inputs, self.variables, self.rules, self.and_op, self.or_op)
+        consequents = np.empty_like(strengths)
+        for r, rule in enumerate(self.rules):
+            z = consequents[:, r]
+            z[:] = rule.consequent.get("const", 0.0)
+            for var, coef in rule.consequent.items():
+                if var != "const":
+                    z += coef * np.asarray(inputs[var], dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.einsum("ij,ij->i", strengths, consequents) / strengths.sum(axis=1)
+
+
+if __name__ == "__main__":
+    # --- Example: fan speed from temperature and humidity ---
+    variables = {
+        "temperature": {"cold": TrapezoidalMF(-1, 0, 10, 20), "warm": TriangularMF(10, 20, 30),
+                        "hot": TrapezoidalMF(20, 30, 40, 41)},
+        "humidity": {"dry": GaussianMF(0, 25), "humid": GaussianMF(100, 25)},
+    }
+    speed = np.linspace(0, 100, 101)
+    speed_terms = {"slow": TriangularMF(-1, 0, 50), "medium": TriangularMF(0, 50, 100),
+                   "fast": TriangularMF(50, 100, 101)}
+    rules = [
+        Rule({"temperature": "cold"}, "slow"),
+        Rule({"temperature": "warm", "humidity": "dry"}, "medium"),
+        Rule({"temperature": "warm", "humidity": "humid"}, "fast"),
+        Rule({"temperature": "hot", "humidity": "humid"}, "fast", connective="or"),
+    ]
+    mamdani = MamdaniSystem(variables, speed, speed_terms, rules)
+
+    samples = {"temperature": np.array([5.0, 18.0, 25.0, 35.0]), "humidity": np.array([20.0, 40.0, 80.0, 60.0])}
+    print("Inputs:", samples)
+    print("Mamdani (centroid) fan speed:", np.round(mamdani.evaluate(samples), 2))
+    mamdani.defuzz = "bisector"
+    print("Mamdani (bisector) fan speed:", np.round(mamdani.evaluate(samples), 2))
+
+    sugeno_rules = [
+        Rule({"temperature": "cold"}, {"const": 10.0}),
+        Rule({"temperature": "warm", "humidity": "dry"}, {"const": 20.0, "temperature": 1.0}),
+        Rule({"temperature": "hot"}, {"const": 40.0, "temperature": 1.0, "humidity": 0.2}),
+    ]
+    sugeno = SugenoSystem(variables, sugeno_rules)
+    print("Sugeno fan speed:", np.round(sugeno.evaluate(samples), 2))
+
+    # --- Throughput on a large batch ---
+    rng = np.random.default_rng()
+    batch = {"temperature": rng.uniform(0, 40, 1_000_000), "humidity": rng.uniform(0, 100, 1_000_000)}
+    mamdani.defuzz = "centroid"
+    start = time.perf_counter()
+    mamdani.evaluate(batch)
+    print(f"Mamdani: {1_000_000 / (time.perf_counter() - start):,.0f} inputs/s")
@@ -1,3 +1,6 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -12,36 +15,247 @@ def trapezoidal(x, a, b, c, d):
 def gaussian(x, mean, sigma):
     return np.exp(-((x - mean)**2) / (2 * sigma**2))
 
-# --- Define universes ---
-X = np.linspace(0, 10, 100)  # Temperature
-Y = np.linspace(0, 10, 100)  # Comfort Level
-
-# --- Compute membership values ---
-μX_tri = triangular(X, 2, 5, 8)
-μY_tri = triangular(Y, 3, 6, 9)
-
-μX_trap = trapezoidal(X, 1, 3, 7, 9)
-μY_trap = trapezoidal(Y, 2, 4, 6, 8)
-
-μX_gauss = gaussian(X, 5, 1.5)
-μY_gauss = gaussian(Y, 6, 1.5)
-
-# --- Fuzzy Relation using min(μX, μY) ---
-R_tri = np.minimum.outer(μX_tri, μY_tri)
-R_trap = np.minimum.outer(μX_trap, μY_trap)
-R_gauss = np.minimum.outer(μX_gauss, μY_gauss)
-
-# --- Plot Membership Functions ---
-plt.figure(figsize=(10,6))
-plt.plot(X, μX_tri, label="Triangular Membership (X)")
-plt.plot(X, μX_trap, label="Trapezoidal Membership (X)")
-plt.plot(X, μX_gauss, label="Gaussian Membership (X)")
-plt.title("Fuzzy Membership Functions")
-plt.xlabel("Input Variable (e.g., Temperature)")
-plt.ylabel("Membership Degree")
-plt.legend()
-plt.grid(True)
-plt.show()
-
-# --- Display Fuzzy Relation Example ---
-print("Sample Fuzzy Relation Matrix (Triangular):\n", np.round(R_tri, 2))
+# --- Membership function objects ---
+# Parameters and slopes are precomputed once, evaluation writes into an
+# optional out= buffer and runs in fixed-size blocks so the only scratch
+# memory is a few block-sized buffers per call, whatever the size of x.
+
+class MembershipFunction:
+    block_size = 65536
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+
+    def __call__(self, x, out=None):
+        x = np.asarray(x, dtype=self.dtype)
+        if out is None:
+            out = np.empty(x.shape, dtype=self.dtype)
+        x_flat = x.reshape(-1)
+        out_flat = out.reshape(-1)
+        if not np.shares_memory(out_flat, out):
+            raise ValueError("out must be a contiguous array")
+        buffers = self.scratch_buffers(min(self.block_size, x_flat.size))
+        for lo in range(0, x_flat.size, self.block_size):
+            hi = min(lo + self.block_size, x_flat.size)
+            self.evaluate_block(x_flat[lo:hi], out_flat[lo:hi], *(b[:hi - lo] for b in buffers))
+        return out
+
+    # Scratch arrays handed to evaluate_block (allocated once per call)
+    def scratch_buffers(self, n):
+        return (np.empty(n, dtype=self.dtype),)
+
+    # Tabulate on [lo, hi] for linear-interpolation lookups (values outside are clamped)
+    def compile(self, lo, hi, size=4096):
+        return LookupTableMF(self, lo, hi, size, self.dtype)
+
+class TriangularMF(MembershipFunction):
+    def __init__(self, a, b, c, dtype=np.float64):
+        super().__init__(dtype)
+        t = self.dtype.type
+        self.a, self.b, self.c = t(a), t(b), t(c)
+        self.rise = t(1 / (b - a))
+        self.fall = t(1 / (c - b))
+
+    def evaluate_block(self, x, out, scratch):
+        # max(0, min((x-a)/(b-a), (c-x)/(c-b)))
+        np.subtract(x, self.a, out=out)
+        out *= self.rise
+        np.subtract(self.c, x, out=scratch)
+        scratch *= self.fall
+        np.minimum(out, scratch, out=out)
+        np.maximum(out, 0, out=out)
+
+class TrapezoidalMF(MembershipFunction):
+    def __init__(self, a, b, c, d, dtype=np.float64):
+        super().__init__(dtype)
+        t = self.dtype.type
+        self.a, self.b, self.c, self.d = t(a), t(b), t(c), t(d)
+        self.rise = t(1 / (b - a))
+        self.fall = t(1 / (d - c))
+
+    def evaluate_block(self, x, out, scratch):
+        # max(0, min(min((x-a)/(b-a), 1), (d-x)/(d-c)))
+        np.subtract(x, self.a, out=out)
+        out *= self.rise
+        np.minimum(out, 1, out=out)
+        np.subtract(self.d, x, out=scratch)
+        scratch *= self.fall
+        np.minimum(out, scratch, out=out)
+        np.maximum(out, 0, out=out)
+
+class GaussianMF(MembershipFunction):
+    def __init__(self, mean, sigma, dtype=np.float64):
+        super().__init__(dtype)
+        t = self.dtype.type
+        self.mean, self.sigma = t(mean), t(sigma)
+        self.coef = t(-1 / (2 * sigma**2))
+
+    def evaluate_block(self, x, out, scratch):
+        # exp(-(x-mean)^2 / (2*sigma^2))
+        np.subtract(x, self.mean, out=out)
+        out *= out
+        out *= self.coef
+        np.exp(out, out=out)
+
+# Uniform-grid linear interpolation (about 200M float32 samples/s here).
+# The closed forms above are faster still, so a table pays off for membership
+# functions that are expensive to evaluate. NaN inputs give NaN.
+class LookupTableMF(MembershipFunction):
+    def __init__(self, mf, lo, hi, size=4096, dtype=np.float64):
+        super().__init__(dtype)
+        t = self.dtype.type
+        grid = np.linspace(lo, hi, size, dtype=self.dtype)
+        self.table = mf(grid)
+        # Slope of each cell; the last entry is 0 so x == hi needs no special case
+        self.delta = np.append(np.diff(self.table), 0).astype(self.dtype)
+        self.lo = t(lo)
+        self.inv_step = t((size - 1) / (hi - lo))
+        self.last = t(size - 1)
+
+    def scratch_buffers(self, n):
+        return np.empty(n, dtype=self.dtype), np.empty(n, dtype=np.intp), np.empty(n, dtype=self.dtype)
+
+    def evaluate_block(self, x, out, frac, idx, values):
+        # Fractional table position, clamped to the tabulated range
+        np.subtract(x, self.lo, out=frac)
+        frac *= self.inv_step
+        np.clip(frac, 0, self.last, out=frac)
+        # NaN casts to an arbitrary index; mode="clip" keeps it in range and
+        # the NaN fraction carries through to the result
+        with np.errstate(invalid="ignore"):
+            np.copyto(idx, frac, casting="unsafe")
+        frac -= idx
+        # table[i] + frac * (table[i+1] - table[i])
+        np.take(self.delta, idx, out=out, mode="clip")
+        out *= frac
+        np.take(self.table, idx, out=values, mode="clip")
+        out += values
+
+
+# --- Fuzzy relations ---
+# A FuzzyRelation is kept lazy: it stores only its two membership vectors
+# and materializes R[i, j] = tnorm(μX[i], μY[j]) one tile at a time.
+
+TNORMS = {"min": np.minimum, "product": np.multiply}
+COMPOSITIONS = {"max-min": "min", "max-product": "product"}
+
+class FuzzyRelation:
+    def __init__(self, mu_x, mu_y, tnorm="min"):
+        self.mu_x = np.asarray(mu_x, dtype=float)
+        self.mu_y = np.asarray(mu_y, dtype=float)
+        self.tnorm = tnorm
+
+    @property
+    def shape(self):
+        return (len(self.mu_x), len(self.mu_y))
+
+    def tile(self, i0, i1, j0, j1):
+        return TNORMS[self.tnorm].outer(self.mu_x[i0:i1], self.mu_y[j0:j1])
+
+    def to_array(self):
+        return self.tile(0, len(self.mu_x), 0, len(self.mu_y))
+
+    # R∘S; see compose()
+    def compose(self, other, method="max-min", **kwargs):
+        return compose(self, other, method, **kwargs)
+
+def relation_tile(R, i0, i1, j0, j1):
+    if isinstance(R, FuzzyRelation):
+        return R.tile(i0, i1, j0, j1)
+    return R[i0:i1, j0:j1]
+
+def compose_tile(R, S, out, i0, i1, k0, k1, tnorm, block):
+    # out[i0:i1, k0:k1] = max_j tnorm(R[i, j], S[j, k]), one j at a time so the
+    # only temporaries are (tile x tile) and (tile x block) arrays
+    acc = np.zeros((i1 - i0, k1 - k0))
+    tmp = np.empty_like(acc)
+    n_mid = R.shape[1]
+    for j0 in range(0, n_mid, block):
+        j1 = min(j0 + block, n_mid)
+        r = relation_tile(R, i0, i1, j0, j1)
+        s = relation_tile(S, j0, j1, k0, k1)
+        for j in range(j1 - j0):
+            tnorm.outer(r[:, j], s[j], out=tmp)
+            np.maximum(acc, tmp, out=acc)
+    out[i0:i1, k0:k1] = acc
+
+def compose(R, S, method="max-min", out=None, memory_budget=64 * 2**20, max_workers=None, tmp_dir=None):
+    """Max-min or max-product composition R∘S of two fuzzy relations.
+
+    R and S may be FuzzyRelation objects or 2-D arrays (including np.memmap).
+    When both are lazy relations built with the composition's own t-norm the
+    result has a closed form and is returned lazily in O(n) memory:
+        max_j T(T(a_i, b_j), T(c_j, d_k)) = T(T(a_i, h), d_k),  h = max_j T(b_j, c_j)
+    Otherwise R∘S is computed in square tiles on a thread pool, writing into
+    `out` (e.g. an np.memmap for very large results). The tile size is chosen
+    so the temporaries of all workers fit in memory_budget bytes. Without out,
+    results larger than memory_budget go to an np.memmap over an anonymous
+    temporary file (in tmp_dir, default the system temp directory) that is
+    removed once the array is released; smaller ones are a regular array.
+    """
+    name = COMPOSITIONS[method]
+    tnorm = TNORMS[name]
+    if R.shape[1] != S.shape[0]:
+        raise ValueError(f"cannot compose relations of shapes {R.shape} and {S.shape}")
+
+    if (isinstance(R, FuzzyRelation) and isinstance(S, FuzzyRelation)
+            and R.tnorm == name and S.tnorm == name and out is None):
+        h = np.max(tnorm(R.mu_y, S.mu_x))
+        return FuzzyRelation(tnorm(R.mu_x, h), S.mu_y, name)
+
+    n_rows, n_cols = R.shape[0], S.shape[1]
+    if out is None and n_rows * n_cols * 8 > memory_budget:
+        # The mapping keeps the (already unlinked) file alive after it is closed here
+        with tempfile.TemporaryFile(dir=tmp_dir) as f:
+            out = np.memmap(f, dtype=float, mode="w+", shape=(n_rows, n_cols))
+    elif out is None:
+        out = np.empty((n_rows, n_cols))
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Each worker holds acc + tmp (tile x tile) and two (tile x tile) input tiles
+    tile = int(np.sqrt(memory_budget / (max_workers * 4 * 8)))
+    tile = max(16, min(tile, 1024))
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        futures = [pool.submit(compose_tile, R, S, out, i0, min(i0 + tile, n_rows),
+                               k0, min(k0 + tile, n_cols), tnorm, tile)
+                   for i0 in range(0, n_rows, tile) for k0 in range(0, n_cols, tile)]
+        for future in futures:
+            future.result()
+    return out
+
+
+if __name__ == "__main__":
+    # --- Define universes ---
+    X = np.linspace(0, 10, 100)  # Temperature
+    Y = np.linspace(0, 10, 100)  # Comfort Level
+
+    # --- Compute membership values ---
+    μX_tri = triangular(X, 2, 5, 8)
+    μY_tri = triangular(Y, 3, 6, 9)
+
+    μX_trap = trapezoidal(X, 1, 3, 7, 9)
+    μY_trap = trapezoidal(Y, 2, 4, 6, 8)
+
+    μX_gauss = gaussian(X, 5, 1.5)
+    μY_gauss = gaussian(Y, 6, 1.5)
+
+    # --- Fuzzy Relation using min(μX, μY) (lazy until displayed) ---
+    R_tri = FuzzyRelation(μX_tri, μY_tri)
+    R_trap = FuzzyRelation(μX_trap, μY_trap)
+    R_gauss = FuzzyRelation(μX_gauss, μY_gauss)
+
+    # --- Plot Membership Functions ---
+    plt.figure(figsize=(10,6))
+    plt.plot(X, μX_tri, label="Triangular Membership (X)")
+    plt.plot(X, μX_trap, label="Trapezoidal Membership (X)")
+    plt.plot(X, μX_gauss, label="Gaussian Membership (X)")
+    plt.title("Fuzzy Membership Functions")
+    plt.xlabel("Input Variable (e.g., Temperature)")
+    plt.ylabel("Membership Degree")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+    # --- Display Fuzzy Relation Example ---
+    print("Sample Fuzzy Relation Matrix (Triangular):\n", np.round(R_tri.to_array(), 2))
@@ -3,12 +3,25 @@ import numpy as np
 # Define the objective function
 def objective_function(x):
     # Example: Sphere function (minimize f(x) = sum(x^2))
-    return np.sum(x**2)
+    # Summing over the last axis lets the same function score a single wolf
+    # (dim,) or a whole pack (n_wolves, dim) in one call
+    return np.sum(x**2, axis=-1)
 
 # Grey Wolf Optimization algorithm
-def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub=10):
+# rng: a numpy Generator, or a seed for np.random.default_rng
+# termination: an optional common.termination.Termination that can stop before max_iter
+def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub=10, vectorized=False,
+                           telemetry=None, checkpoint=None, resume=None, rng=None, termination=None):
+    # Vectorized engine: obj_func must score the whole (n_wolves, dim) pack at once
+    if vectorized:
+        return vectorized_grey_wolf_optimization(obj_func, dim, n_wolves, max_iter, lb, ub, telemetry,
+                                                 checkpoint, resume, rng, termination)
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+
     # Initialize the positions of search agents (wolves)
-    wolves = np.random.uniform(lb, ub, (n_wolves, dim))
+    wolves = rng.uniform(lb, ub, (n_wolves, dim))
     
     # Initialize Alpha, Beta, Delta (best three wolves)
     X_alpha = np.zeros(dim)
@@ -17,6 +30,7 @@ def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub
     alpha_score = float("inf")
     beta_score = float("inf")
     delta_score = float("inf")
+    scores = np.empty(n_wolves)
 
     # Main loop
     for iter in range(max_iter):
@@ -27,6 +41,7 @@ def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub
 
             # Calculate fitness
             fitness = obj_func(wolves[i])
+            scores[i] = fitness
 
             # Update Alpha, Beta, Delta
             if fitness < alpha_score:
@@ -39,24 +54,31 @@ def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub
                 delta_score = fitness
                 X_delta = wolves[i].copy()
 
+        # Record iteration info (the pack that was just scored, before it moves)
+        if telemetry is not None:
+            telemetry.observe(iter, alpha_score, wolves, scores, (iter + 1) * n_wolves)
+        if termination is not None and termination.update(iter, alpha_score, wolves, (iter + 1) * n_wolves):
+            break
+
         # Parameter 'a' decreases linearly from 2 to 0
         a = 2 - iter * (2 / max_iter)
 
-        # Update the position of each wolf
+        # Update the position of each wolf; one block of (r1, r2) pairs per iteration
+        r = rng.random((n_wolves, 3, 2))
         for i in range(n_wolves):
-            r1, r2 = np.random.rand(), np.random.rand()
+            r1, r2 = r[i, 0]
             A1 = 2 * a * r1 - a
             C1 = 2 * r2
             D_alpha = abs(C1 * X_alpha - wolves[i])
             X1 = X_alpha - A1 * D_alpha
 
-            r1, r2 = np.random.rand(), np.random.rand()
+            r1, r2 = r[i, 1]
             A2 = 2 * a * r1 - a
             C2 = 2 * r2
             D_beta = abs(C2 * X_beta - wolves[i])
             X2 = X_beta - A2 * D_beta
 
-            r1, r2 = np.random.rand(), np.random.rand()
+            r1, r2 = r[i, 2]
             A3 = 2 * a * r1 - a
             C3 = 2 * r2
             D_delta = abs(C3 * X_delta - wolves[i])
@@ -65,17 +87,175 @@ def grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub
             # Average position update
             wolves[i] = (X1 + X2 + X3) / 3
 
-        # Print iteration info
-        print(f"Iteration {iter+1}/{max_iter} | Best Fitness: {alpha_score:.6f}")
-
     # Return the best solution found
     return X_alpha, alpha_score
 
 
-# Run the algorithm
-best_pos, best_score = grey_wolf_optimization(objective_function, dim=2, n_wolves=15, max_iter=100)
+# Same leaders as the loop's if/elif chain over the pack in order: a wolf
+# replaces the first leader it beats, and a replaced leader is not demoted.
+# Leader k's score just before each wolf is a running minimum over the wolves
+# that did not already replace a better leader, so each leader is one
+# np.minimum.accumulate; the last wolf that beat it is the new leader.
+def update_leaders(wolves, fitness, leaders, leader_scores):
+    leaders, leader_scores = leaders.copy(), leader_scores.copy()
+    taken = np.zeros(len(fitness), dtype=bool)
+    for k in range(3):
+        candidates = np.where(taken, np.inf, fitness)
+        before = np.minimum.accumulate(np.concatenate(([leader_scores[k]], candidates[:-1])))
+        hits = ~taken & (fitness < before)
+        if hits.any():
+            last = np.flatnonzero(hits)[-1]
+            leaders[k], leader_scores[k] = wolves[last], fitness[last]
+        taken |= hits
+    return leaders, leader_scores
+
+# Vectorized Grey Wolf Optimization
+# The whole pack moves as one (n_wolves, dim) array per iteration and
+# obj_func(wolves) must return an (n_wolves,) array of fitness values.
+# checkpoint.save() gets the pack and leaders after every iteration;
+# resume (a state dict from checkpoint.load(rng=rng)) continues from it.
+def vectorized_grey_wolf_optimization(obj_func, dim=2, n_wolves=10, max_iter=50, lb=-10, ub=10, telemetry=None,
+                                      checkpoint=None, resume=None, rng=None, termination=None):
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    if resume is None:
+        wolves = rng.uniform(lb, ub, (n_wolves, dim))
+
+        # Rows 0, 1, 2 hold Alpha, Beta, Delta
+        leaders = np.zeros((3, dim))
+        leader_scores = np.full(3, float("inf"))
+        start = 0
+    else:
+        # Continue a checkpointed run (no random draws, load() restored the generator state)
+        wolves = np.array(resume["wolves"])
+        leaders = np.array(resume["leaders"])
+        leader_scores = np.array(resume["leader_scores"])
+        start = resume["iteration"]
+
+    # Work buffers reused every iteration
+    step = np.empty_like(wolves)
+    new_wolves = np.empty_like(wolves)
+
+    for iter in range(start, max_iter):
+        # Keep wolves within search space and score the whole pack
+        np.clip(wolves, lb, ub, out=wolves)
+        fitness = np.asarray(obj_func(wolves), dtype=float).reshape(n_wolves)
+        leaders, leader_scores = update_leaders(wolves, fitness, leaders, leader_scores)
+
+        # Record iteration info (the pack that was just scored, before it moves)
+        if telemetry is not None:
+            telemetry.observe(iter, leader_scores[0], wolves, fitness, (iter + 1) * n_wolves)
+
+        # Parameter 'a' decreases linearly from 2 to 0
+        a = 2 - iter * (2 / max_iter)
+
+        # The per-wolf loop's (n_wolves, 3, 2) block of (r1, r2) pairs, so a seed gives the same run in both modes
+        r = rng.random((n_wolves, 3, 2))
+        A = 2 * a * r[..., 0].T[:, :, None] - a
+        C = 2 * r[..., 1].T[:, :, None]
+
+        # X_k = X_leader - A_k * |C_k * X_leader - X|, averaged over k
+        new_wolves.fill(0.0)
+        for k in range(3):
+            np.multiply(C[k], leaders[k], out=step)
+            step -= wolves
+            np.abs(step, out=step)
+            step *= A[k]
+            np.subtract(leaders[k], step, out=step)
+            new_wolves += step
+        new_wolves /= 3
+        wolves, new_wolves = new_wolves, wolves
+
+        if checkpoint is not None:
+            checkpoint.save(iter + 1, {"wolves": wolves, "leaders": leaders, "leader_scores": leader_scores}, rng)
+        # new_wolves is the pack scored this iteration (until the next one overwrites it)
+        if termination is not None and termination.update(iter, leader_scores[0], new_wolves, (iter + 1) * n_wolves):
+            break
+
+    # Return the best solution found
+    return leaders[0].copy(), leader_scores[0]
+
+
+# Per-replica version of update_leaders: wolves (R, n, dim), fitness (R, n), leaders (R, 3, dim)
+def update_batched_leaders(wolves, fitness, leaders, leader_scores):
+    leaders, leader_scores = leaders.copy(), leader_scores.copy()
+    n = fitness.shape[1]
+    taken = np.zeros(fitness.shape, dtype=bool)
+    for k in range(3):
+        candidates = np.where(taken, np.inf, fitness)
+        before = np.minimum.accumulate(np.concatenate((leader_scores[:, k:k + 1], candidates[:, :-1]), axis=1), axis=1)
+        hits = ~taken & (fitness < before)
+        replaced = np.flatnonzero(hits.any(axis=1))
+        last = n - 1 - np.argmax(hits[replaced, ::-1], axis=1)
+        leaders[replaced, k] = wolves[replaced, last]
+        leader_scores[replaced, k] = fitness[replaced, last]
+        taken |= hits
+    return leaders, leader_scores
+
+# Replica-batched Grey Wolf Optimization
+# n_replicas independent packs are stored as one (n_replicas, n_wolves, dim)
+# tensor and advanced together, so many-seed statistics cost one vectorized
+# step per iteration instead of one Python loop per seed. obj_func(wolves)
+# must return an (n_replicas, n_wolves) array (summing over axis=-1 does).
+# All replicas draw from one generator, so replica r is an independent run
+# but not the same run as vectorized_grey_wolf_optimization(rng=r).
+# Returns (best positions (R, dim), best scores (R,), convergence (R, max_iter)).
+def batched_grey_wolf_optimization(obj_func, n_replicas=100, dim=2, n_wolves=10, max_iter=50, lb=-10, ub=10,
+                                   rng=None):
+    rng = np.random.default_rng(rng)
+    wolves = rng.uniform(lb, ub, (n_replicas, n_wolves, dim))
+
+    # Rows 0, 1, 2 of every replica hold its Alpha, Beta, Delta
+    leaders = np.zeros((n_replicas, 3, dim))
+    leader_scores = np.full((n_replicas, 3), float("inf"))
+    convergence = np.empty((n_replicas, max_iter))
+
+    # Work buffers reused every iteration
+    step = np.empty_like(wolves)
+    new_wolves = np.empty_like(wolves)
+
+    for iter in range(max_iter):
+        np.clip(wolves, lb, ub, out=wolves)
+        fitness = np.asarray(obj_func(wolves), dtype=float).reshape(n_replicas, n_wolves)
+        leaders, leader_scores = update_batched_leaders(wolves, fitness, leaders, leader_scores)
+        convergence[:, iter] = leader_scores[:, 0]
+
+        a = 2 - iter * (2 / max_iter)
+        A = 2 * a * rng.random((3, n_replicas, n_wolves, 1)) - a
+        C = 2 * rng.random((3, n_replicas, n_wolves, 1))
+
+        new_wolves.fill(0.0)
+        for k in range(3):
+            leader = leaders[:, k:k + 1]   # (R, 1, dim), broadcast over the pack
+            np.multiply(C[k], leader, out=step)
+            step -= wolves
+            np.abs(step, out=step)
+            step *= A[k]
+            np.subtract(leader, step, out=step)
+            new_wolves += step
+        new_wolves /= 3
+        wolves, new_wolves = new_wolves, wolves
+
+    return leaders[:, 0].copy(), leader_scores[:, 0].copy(), convergence
+
+
+if __name__ == "__main__":
+    # Run the algorithm
+    best_pos, best_score = grey_wolf_optimization(objective_function, dim=2, n_wolves=15, max_iter=100)
+
+    print("\n------------------------------")
+    print("Best Solution (Position):", best_pos)
+    print("Best Objective Value (Fitness):", best_score)
+    print("------------------------------")
+
+    # Both engines make the same draws, so one seed gives the same leaders
+    loop = grey_wolf_optimization(objective_function, dim=2, n_wolves=15, max_iter=100, rng=1)
+    vectorized = grey_wolf_optimization(objective_function, dim=2, n_wolves=15, max_iter=100, rng=1, vectorized=True)
+    assert np.array_equal(loop[0], vectorized[0]) and loop[1] == vectorized[1], (loop, vectorized)
+    print("Loop and vectorized engines agree for rng=1:", vectorized[1])
 
-print("\n------------------------------")
-print("Best Solution (Position):", best_pos)
-print("Best Objective Value (Fitness):", best_score)
-print("------------------------------")
+    # 100 independent runs in one batch, for statistics over seeds
+    _, scores, _ = batched_grey_wolf_optimization(objective_function, n_replicas=100, dim=2, n_wolves=15,
+                                                  max_iter=100)
+    print(f"100 replicas: median {np.median(scores):.3e}, worst {scores.max():.3e}")
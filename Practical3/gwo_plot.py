@@ -1,5 +1,4 @@
 import numpy as np
-import random
 import matplotlib.pyplot as plt
 
 # Fitness function
@@ -7,11 +6,17 @@ def fitness_function(x):
     return x**2
 
 # Grey Wolf Optimizer
-def GWO(num_wolves=8, max_iter=50, lb=-10, ub=10):
-    wolves = np.random.uniform(lb, ub, num_wolves)
+# rng: a numpy Generator, or a seed for np.random.default_rng
+# termination: an optional common.termination.Termination (the curve ends where it stopped)
+def GWO(num_wolves=8, max_iter=50, lb=-10, ub=10, fitness_function=fitness_function, telemetry=None, rng=None,
+        termination=None):
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    wolves = rng.uniform(lb, ub, num_wolves)
     alpha, beta, delta = None, None, None
 
-    convergence_curve = []  # store best fitness per iteration
+    convergence_curve = np.empty(max_iter)  # store best fitness per iteration
 
     for t in range(max_iter):
         fitness = [fitness_function(w) for w in wolves]
@@ -22,28 +27,38 @@ def GWO(num_wolves=8, max_iter=50, lb=-10, ub=10):
         fitness = [fitness[i] for i in sorted_idx]
 
         alpha, beta, delta = wolves[0], wolves[1], wolves[2]
+        alpha_fitness = fitness[0]
+
+        # Store best fitness of this iteration (recorded on the pack that was just scored)
+        convergence_curve[t] = alpha_fitness
+        if telemetry is not None:
+            telemetry.observe(t, alpha_fitness, wolves, fitness, (t + 1) * num_wolves)
+        if termination is not None and termination.update(t, alpha_fitness, wolves, (t + 1) * num_wolves):
+            convergence_curve = convergence_curve[:t + 1]
+            break
 
         a = 2 - t * (2 / max_iter)  # linearly decreases from 2 to 0
         new_wolves = []
+        r = rng.random((num_wolves, 6))  # all random numbers of this iteration in one block
 
         for i in range(num_wolves):
             X = wolves[i]
 
             # Update with respect to alpha
-            A1 = 2 * a * random.random() - a
-            C1 = 2 * random.random()
+            A1 = 2 * a * r[i, 0] - a
+            C1 = 2 * r[i, 1]
             D_alpha = abs(C1 * alpha - X)
             X1 = alpha - A1 * D_alpha
 
             # Update with respect to beta
-            A2 = 2 * a * random.random() - a
-            C2 = 2 * random.random()
+            A2 = 2 * a * r[i, 2] - a
+            C2 = 2 * r[i, 3]
             D_beta = abs(C2 * beta - X)
             X2 = beta - A2 * D_beta
 
             # Update with respect to delta
-            A3 = 2 * a * random.random() - a
-            C3 = 2 * random.random()
+            A3 = 2 * a * r[i, 4] - a
+            C3 = 2 * r[i, 5]
             D_delta = abs(C3 * delta - X)
             X3 = delta - A3 * D_delta
 
@@ -56,21 +71,19 @@ def GWO(num_wolves=8, max_iter=50, lb=-10, ub=10):
 
         wolves = np.array(new_wolves)
 
-        # Store best fitness of this iteration
-        convergence_curve.append(fitness_function(alpha))
-
-    return alpha, fitness_function(alpha), convergence_curve
+    return alpha, alpha_fitness, convergence_curve
 
-# Run GWO
-best_sol, best_fit, curve = GWO(num_wolves=8, max_iter=50)
+if __name__ == "__main__":
+    # Run GWO
+    best_sol, best_fit, curve = GWO(num_wolves=8, max_iter=50)
 
-print("Best solution found:", best_sol)
-print("Fitness value:", best_fit)
+    print("Best solution found:", best_sol)
+    print("Fitness value:", best_fit)
 
-# Plot convergence
-plt.plot(curve, 'b-', linewidth=2)
-plt.xlabel("Iteration")
-plt.ylabel("Fitness (Best so far)")
-plt.title("GWO Convergence Curve")
-plt.grid(True)
-plt.show()
+    # Plot convergence
+    plt.plot(curve, 'b-', linewidth=2)
+    plt.xlabel("Iteration")
+    plt.ylabel("Fitness (Best so far)")
+    plt.title("GWO Convergence Curve")
+    plt.grid(True)
+    plt.show()
@@ -5,17 +5,24 @@ import numpy as np
 # Example: f(x) = x^2   --> minimum at x = 0
 # -------------------------------------------
 def fitness_function(x):
-    return np.sum(x**2)   # You can change this as per problem
+    return np.sum(x**2, axis=-1)   # You can change this as per problem (works on one crow or a whole flock)
 
 # -------------------------------------------
 # Crow Search Optimization (CSO)
 # -------------------------------------------
-def crow_search_optimization(num_crows=10, dim=2, max_iter=50, flight_length=2.0, awareness_prob=0.1):
+def crow_search_optimization(num_crows=10, dim=2, max_iter=50, flight_length=2.0, awareness_prob=0.1,
+                             fitness_function=fitness_function, telemetry=None, rng=None, termination=None):
+    # rng: a numpy Generator, or a seed for np.random.default_rng
+    # termination: an optional common.termination.Termination that can stop before max_iter
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+
     # Step 1: Initialize positions of crows randomly
     # Here, we assume the search space is [-10, 10]
     lower_bound = -10
     upper_bound = 10
-    positions = np.random.uniform(lower_bound, upper_bound, (num_crows, dim))
+    positions = rng.uniform(lower_bound, upper_bound, (num_crows, dim))
     
     # Step 2: Initialize memory of each crow (best position so far)
     memory = np.copy(positions)
@@ -28,21 +35,25 @@ def crow_search_optimization(num_crows=10, dim=2, max_iter=50, flight_length=2.0
     
     # Step 4: Main loop
     for iteration in range(max_iter):
+        # Random numbers for the whole flock in one block: the crow each one
+        # follows (uniform over j != i) and its r
+        follow = rng.integers(0, num_crows - 1, num_crows)
+        follow += follow >= np.arange(num_crows)
+        r_all = rng.random(num_crows)
+
         for i in range(num_crows):
             # Randomly select another crow to follow
-            j = np.random.randint(0, num_crows)
-            while j == i:
-                j = np.random.randint(0, num_crows)
+            j = follow[i]
             
             # Generate a random number
-            r = np.random.rand()
+            r = r_all[i]
             
             if r >= awareness_prob:
                 # Crow i follows crow j's memory (not aware)
                 new_position = positions[i] + r * flight_length * (memory[j] - positions[i])
             else:
                 # Crow j is aware, moves to random position
-                new_position = np.random.uniform(lower_bound, upper_bound, dim)
+                new_position = rng.uniform(lower_bound, upper_bound, dim)
             
             # Boundary check
             new_position = np.clip(new_position, lower_bound, upper_bound)
@@ -65,13 +76,125 @@ def crow_search_optimization(num_crows=10, dim=2, max_iter=50, flight_length=2.0
             global_best_fitness = fitness[best_index]
             global_best = positions[best_index]
         
-        print(f"Iteration {iteration+1} → Best Fitness: {global_best_fitness:.5f}")
+        if telemetry is not None:
+            telemetry.observe(iteration, global_best_fitness, positions, fitness, (3 * iteration + 4) * num_crows)
+        if termination is not None and termination.update(iteration, global_best_fitness, positions,
+                                                          (3 * iteration + 4) * num_crows):
+            break
     
     print("\nBest solution found:")
     print("Position:", global_best)
     print("Fitness:", global_best_fitness)
 
+# -------------------------------------------
+# Vectorized Crow Search Optimization (engine mode)
+# fitness_function(positions) scores a whole (num_crows, dim) array at once.
+# Memory fitness is stored and only updated on improvement, so each
+# iteration costs exactly num_crows objective evaluations.
+# -------------------------------------------
+def vectorized_crow_search_optimization(fitness_function=fitness_function, num_crows=10, dim=2, max_iter=50,
+                                        flight_length=2.0, awareness_prob=0.1, lower_bound=-10, upper_bound=10,
+                                        telemetry=None, checkpoint=None, resume=None, rng=None, termination=None):
+    # Step 1: Memory of each crow (best position so far); crows always fly
+    # from their memory, so memory doubles as the current positions
+    if num_crows < 2:
+        raise ValueError(f"Crow search needs at least 2 crows (each follows another), got {num_crows}")
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    start = 0
+    if resume is not None:
+        # Continue a checkpointed run (the crows' memory is the whole state)
+        memory = np.array(resume["memory"])
+        memory_fitness = np.array(resume["memory_fitness"])
+        evaluations, start = resume["evaluations"], resume["iteration"]
+    else:
+        memory = rng.uniform(lower_bound, upper_bound, (num_crows, dim))
+        memory_fitness = np.asarray(fitness_function(memory), dtype=float)
+        evaluations = num_crows
+
+    crows = np.arange(num_crows)
+    for iteration in range(start, max_iter):
+        # Step 2: Every crow picks another crow to follow (uniform over j != i)
+        targets = rng.integers(0, num_crows - 1, num_crows)
+        targets += targets >= crows
+
+        # Step 3: Follow the target's memory, or move randomly if the target is aware
+        r = rng.random((num_crows, 1))
+        new_positions = memory + r * flight_length * (memory[targets] - memory)
+        aware = r[:, 0] < awareness_prob
+        new_positions[aware] = rng.uniform(lower_bound, upper_bound, (np.count_nonzero(aware), dim))
+        np.clip(new_positions, lower_bound, upper_bound, out=new_positions)
+
+        # Step 4: One evaluation per crow; memory (and its fitness) only changes on improvement
+        new_fitness = np.asarray(fitness_function(new_positions), dtype=float)
+        evaluations += num_crows
+        improved = new_fitness < memory_fitness
+        memory[improved] = new_positions[improved]
+        memory_fitness[improved] = new_fitness[improved]
+
+        if telemetry is not None:
+            telemetry.observe(iteration, memory_fitness.min(), memory, memory_fitness, evaluations)
+        if checkpoint is not None:
+            checkpoint.save(iteration + 1, {"memory": memory, "memory_fitness": memory_fitness,
+                                            "evaluations": evaluations}, rng)
+        if termination is not None and termination.update(iteration, memory_fitness.min(), memory, evaluations):
+            break
+
+    best_index = np.argmin(memory_fitness)
+    return memory[best_index].copy(), memory_fitness[best_index], evaluations
+
+# -------------------------------------------
+# Replica-batched Crow Search Optimization
+# n_replicas independent flocks live in one (n_replicas, num_crows, dim)
+# tensor and take each step together; fitness_function must score it as
+# (n_replicas, num_crows). Returns per-replica best positions (R, dim),
+# best fitness (R,), the evaluations of each replica and the convergence
+# curves (R, max_iter).
+# -------------------------------------------
+def batched_crow_search_optimization(fitness_function=fitness_function, n_replicas=100, num_crows=10, dim=2,
+                                     max_iter=50, flight_length=2.0, awareness_prob=0.1, lower_bound=-10,
+                                     upper_bound=10, rng=None):
+    if num_crows < 2:
+        raise ValueError(f"Crow search needs at least 2 crows (each follows another), got {num_crows}")
+    rng = np.random.default_rng(rng)
+    shape = (n_replicas, num_crows)
+    memory = rng.uniform(lower_bound, upper_bound, shape + (dim,))
+    memory_fitness = np.asarray(fitness_function(memory), dtype=float).reshape(shape)
+    evaluations = num_crows
+    convergence = np.empty((n_replicas, max_iter))
+
+    replicas = np.arange(n_replicas)[:, None]
+    crows = np.arange(num_crows)
+    for iteration in range(max_iter):
+        # Every crow picks another crow of its own flock to follow
+        targets = rng.integers(0, num_crows - 1, shape)
+        targets += targets >= crows
+
+        r = rng.random(shape + (1,))
+        new_positions = memory + r * flight_length * (memory[replicas, targets] - memory)
+        aware = r[..., 0] < awareness_prob
+        new_positions[aware] = rng.uniform(lower_bound, upper_bound, (np.count_nonzero(aware), dim))
+        np.clip(new_positions, lower_bound, upper_bound, out=new_positions)
+
+        new_fitness = np.asarray(fitness_function(new_positions), dtype=float).reshape(shape)
+        evaluations += num_crows
+        improved = new_fitness < memory_fitness
+        memory[improved] = new_positions[improved]
+        memory_fitness[improved] = new_fitness[improved]
+        convergence[:, iteration] = memory_fitness.min(axis=1)
+
+    best = np.argmin(memory_fitness, axis=1)
+    return memory[replicas[:, 0], best], memory_fitness[replicas[:, 0], best], evaluations, convergence
+
 # -------------------------------------------
 # Run the algorithm
 # -------------------------------------------
-crow_search_optimization()
+if __name__ == "__main__":
+    crow_search_optimization()
+
+    position, best_fitness, evaluations = vectorized_crow_search_optimization(rng=1)
+    print("\nVectorized engine:")
+    print("Position:", position)
+    print("Fitness:", best_fitness)
+    print("Objective evaluations:", evaluations)
@@ -1,4 +1,5 @@
 import numpy as np
+from multiprocessing import Pool, shared_memory
 
 # --- 1. FIXED MATRICES AND PARAMETERS ---
 
@@ -8,9 +9,6 @@ num_nodes = len(PLACES)
 start_node = 0 # Tree
 end_node = num_nodes - 1 # Pond
 
-print("--- Ant Colony Optimization Setup (4 Cities) ---")
-print(f"Places: {', '.join(PLACES)}. Start: {PLACES[start_node]}, End: {PLACES[end_node]}.")
-
 # User-Defined Cost (Distance) Matrix
 COST_MATRIX = np.array([
     [0, 5, 15, 4],
@@ -18,25 +16,6 @@ COST_MATRIX = np.array([
     [15, 4, 0, 1],
     [4, 8, 1, 0]
 ], dtype=float)
-print("\nCOST MATRIX (Fixed):")
-print(COST_MATRIX)
-
-# User-Input for Initial Pheromone Matrix
-PHEROMONE_MATRIX = np.zeros((num_nodes, num_nodes), dtype=float)
-print("\nEnter Initial Pheromone Matrix (4x4):")
-for i in range(num_nodes):
-    while True:
-        try:
-            # Example input prompt for row i
-            row_input = input(f"Enter Pheromone values for row {i} (e.g., '0.0 0.2 0.1 0.3'): ").split()
-            if len(row_input) != num_nodes: raise ValueError
-            PHEROMONE_MATRIX[i, :] = [float(x) for x in row_input]
-            break
-        except ValueError:
-            print("Invalid input. Please enter exactly 4 numbers separated by spaces.")
-
-# Ensure self-loops have zero pheromone for movement logic
-np.fill_diagonal(PHEROMONE_MATRIX, 0.0) 
 
 # ACO Parameters (Set these as constants or take user input if preferred)
 ALPHA = 1.0  # Pheromone Importance
@@ -44,12 +23,33 @@ BETA = 2.0   # Heuristic Importance (Cost/Distance Importance)
 Q = 1.0      # Pheromone Deposit Constant
 RHO = 0.1    # Evaporation Rate (Adjustable, 0.0 for no evaporation)
 
+def heuristic_matrix(cost_mat):
+    """Visibility = 1 / Cost, with zero on the diagonal."""
+    heuristic_mat = 1.0 / (cost_mat + np.finfo(float).eps)
+    np.fill_diagonal(heuristic_mat, 0)
+    return heuristic_mat
+
 # Heuristic Matrix (Visibility = 1 / Cost)
-HEURISTIC_MATRIX = 1.0 / (COST_MATRIX + np.finfo(float).eps)
-np.fill_diagonal(HEURISTIC_MATRIX, 0) 
+HEURISTIC_MATRIX = heuristic_matrix(COST_MATRIX)
+
+def read_pheromone_matrix():
+    """Reads the initial pheromone matrix row by row from the user."""
+    pheromone_mat = np.zeros((num_nodes, num_nodes), dtype=float)
+    print(f"\nEnter Initial Pheromone Matrix ({num_nodes}x{num_nodes}):")
+    for i in range(num_nodes):
+        while True:
+            try:
+                # Example input prompt for row i
+                row_input = input(f"Enter Pheromone values for row {i} (e.g., '0.0 0.2 0.1 0.3'): ").split()
+                if len(row_input) != num_nodes: raise ValueError
+                pheromone_mat[i, :] = [float(x) for x in row_input]
+                break
+            except ValueError:
+                print(f"Invalid input. Please enter exactly {num_nodes} numbers separated by spaces.")
 
-print(f"\nParameters: Alpha={ALPHA}, Beta={BETA}, Q={Q}, Rho={RHO}")
-print("-" * 50)
+    # Ensure self-loops have zero pheromone for movement logic
+    np.fill_diagonal(pheromone_mat, 0.0)
+    return pheromone_mat
 
 
 # --- 2. ACO CORE FUNCTIONS (Unchanged from previous optimal code) ---
@@ -74,8 +74,9 @@ def calculate_transition_probability(current_node, unvisited_nodes, pheromone_ma
     else:
         return {node: prob / total_attractiveness for node, prob in probabilities.items()}
 
-def find_ant_path(start, end, pheromone_mat, heuristic_mat):
+def find_ant_path(start, end, pheromone_mat, heuristic_mat, rng=None):
     """Simulates an ant finding a path from start to end."""
+    rng = np.random.default_rng(rng)
     path = [start]
     current_node = start
     unvisited = set(range(num_nodes))
@@ -94,8 +95,8 @@ def find_ant_path(start, end, pheromone_mat, heuristic_mat):
         
         if not nodes: break
         
-        # Stochastic selection using numpy.random.choice
-        next_node = np.random.choice(nodes, size=1, p=probabilities)[0]
+        # Stochastic selection using Generator.choice
+        next_node = rng.choice(nodes, size=1, p=probabilities)[0]
         
         path.append(next_node)
         current_node = next_node
@@ -132,44 +133,469 @@ def update_pheromone_matrix(pheromone_mat, paths_costs, rho, Q):
 
     return pheromone_mat
 
+# --- 2b. COLONY-LEVEL FUNCTIONS (all ants move together) ---
+
+def construct_colony_paths(start, end, pheromone_mat, heuristic_mat, n_ants, alpha=ALPHA, beta=BETA, rng=None):
+    """Builds n_ants paths at once; returns an (n_ants, n + 1) array for a tour or (n_ants, n) otherwise.
+
+    Every ant starts at `start`, visits every other node exactly once and
+    finishes at `end` (back at `start` when start == end). The attractiveness
+    matrix is computed once, and each step picks the next node of every ant
+    with one cumulative-sum draw over its row, masked by the visited nodes.
+    """
+    rng = np.random.default_rng(rng)
+    n = pheromone_mat.shape[0]
+    attractiveness = (pheromone_mat ** alpha) * (heuristic_mat ** beta)
+
+    n_free = n - 1 if start == end else n - 2
+    paths = np.empty((n_ants, n_free + 2), dtype=np.intp)
+    paths[:, 0] = start
+    paths[:, -1] = end
+
+    visited = np.zeros((n_ants, n), dtype=bool)
+    visited[:, start] = True
+    visited[:, end] = True
+    current = np.full(n_ants, start, dtype=np.intp)
+    ants = np.arange(n_ants)
+
+    for step in range(1, n_free + 1):
+        weights = attractiveness[current]
+        weights[visited] = 0.0
+        cumulative = np.cumsum(weights, axis=1)
+
+        # Ants that only see zero attractiveness choose uniformly (as in calculate_transition_probability)
+        stuck = ~(cumulative[:, -1] > 0)
+        if stuck.any():
+            cumulative[stuck] = np.cumsum(~visited[stuck], axis=1)
+
+        # r in (0, total], so the first cumulative >= r is always an unvisited node
+        r = (1.0 - rng.random(n_ants)) * cumulative[:, -1]
+        next_nodes = np.argmax(cumulative >= r[:, None], axis=1)
+
+        paths[:, step] = next_nodes
+        visited[ants, next_nodes] = True
+        current = next_nodes
+
+    return paths
+
+def calculate_colony_costs(paths, cost_mat):
+    """Calculates the total cost of every path in an (n_ants, length) array."""
+    return cost_mat[paths[:, :-1], paths[:, 1:]].sum(axis=1)
+
+def update_pheromone_colony(pheromone_mat, paths, costs, rho, Q):
+    """Applies evaporation and symmetric deposition for a whole colony of paths."""
+    pheromone_mat *= (1.0 - rho)
+
+    costs = np.asarray(costs, dtype=float)
+    delta_tau = np.divide(Q, costs, out=np.zeros_like(costs), where=costs > 0)
+    deposits = np.repeat(delta_tau, paths.shape[1] - 1)
+    starts = paths[:, :-1].ravel()
+    ends = paths[:, 1:].ravel()
+    np.add.at(pheromone_mat, (starts, ends), deposits)
+    np.add.at(pheromone_mat, (ends, starts), deposits) # Symmetric deposition
+
+    return pheromone_mat
+
+def run_colony(cost_mat, pheromone_mat, start, end, n_ants, n_iter, alpha=ALPHA, beta=BETA, rho=RHO, Q=Q,
+               checkpoint=None, resume=None, rng=None, termination=None):
+    """Runs n_iter colony iterations; returns (best_path, best_cost, pheromone_mat).
+
+    checkpoint.save() gets the pheromone matrix and best tour after every
+    iteration; resume (a state dict from checkpoint.load(rng=rng)) continues from it.
+    termination (a common.termination.Termination) can stop earlier; one
+    evaluation is one constructed tour.
+    """
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    heuristic_mat = heuristic_matrix(cost_mat)
+    best_path, best_cost, first = None, float("inf"), 0
+    if resume is not None:
+        pheromone_mat[:] = resume["pheromone"]
+        best_path, best_cost, first = resume.get("best_path"), resume["best_cost"], resume["iteration"]
+
+    for it in range(first, n_iter):
+        paths = construct_colony_paths(start, end, pheromone_mat, heuristic_mat, n_ants, alpha, beta, rng)
+        costs = calculate_colony_costs(paths, cost_mat)
+
+        best_ant = np.argmin(costs)
+        if costs[best_ant] < best_cost:
+            best_cost = costs[best_ant]
+            best_path = paths[best_ant].copy()
+
+        pheromone_mat = update_pheromone_colony(pheromone_mat, paths, costs, rho, Q)
+        if checkpoint is not None:
+            checkpoint.save(it + 1, {"pheromone": pheromone_mat, "best_path": best_path, "best_cost": best_cost}, rng)
+        if termination is not None and termination.update(it, best_cost, None, (it + 1) * n_ants):
+            break
+
+    return best_path, best_cost, pheromone_mat
+
+# --- 2c. CANDIDATE-LIST GRAPH (sparse storage for large instances) ---
+
+def nearest_neighbours(coords, k, block_size=256):
+    """Returns the k nearest other nodes of every node (closest first) as (n, k) indices and distances."""
+    n = len(coords)
+    neighbors = np.empty((n, k), dtype=np.int32)
+    distances = np.empty((n, k), dtype=float)
+    squared_norms = np.einsum("ij,ij->i", coords, coords)
+
+    # Squared distances are computed block_size rows at a time so memory stays O(block_size * n)
+    for lo in range(0, n, block_size):
+        hi = min(lo + block_size, n)
+        d2 = squared_norms[lo:hi, None] - 2.0 * (coords[lo:hi] @ coords.T) + squared_norms[None, :]
+        d2[np.arange(hi - lo), np.arange(lo, hi)] = np.inf  # no self-loops
+
+        idx = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        d2_k = np.take_along_axis(d2, idx, axis=1)
+        order = np.argsort(d2_k, axis=1)
+        neighbors[lo:hi] = np.take_along_axis(idx, order, axis=1)
+        distances[lo:hi] = np.sqrt(np.maximum(np.take_along_axis(d2_k, order, axis=1), 0.0))
+
+    return neighbors, distances
+
+def ring_offsets(r):
+    """(dx, dy) of the grid cells at Chebyshev distance r from a cell."""
+    if r == 0:
+        return np.zeros((1, 2), dtype=np.intp)
+    side = np.arange(-r, r + 1)
+    inner = side[1:-1]
+    return np.concatenate((np.column_stack((side, np.full_like(side, -r))),
+                           np.column_stack((side, np.full_like(side, r))),
+                           np.column_stack((np.full_like(inner, -r), inner)),
+                           np.column_stack((np.full_like(inner, r), inner))))
+
+class CandidateGraph:
+    """Euclidean graph that keeps pheromone and heuristic only on each node's k nearest-neighbour edges.
+
+    Row i of `neighbors`, `costs`, `heuristic` and `pheromone` is the CSR row
+    of node i (every row has exactly k entries), so memory is O(n * k)
+    instead of the O(n^2) of COST_MATRIX / PHEROMONE_MATRIX.
+    `extended` (the k_ext nearest nodes, default 4k) and a uniform grid of
+    about two nodes per cell are what construct_candidate_paths searches
+    when all of an ant's candidates are visited.
+    """
+
+    def __init__(self, coords, k=10, tau0=1.0, k_ext=None):
+        self.coords = np.asarray(coords, dtype=float)
+        self.n = len(self.coords)
+        self.k = min(k, self.n - 1)
+        self.tau0 = tau0
+        self.extended, distances = nearest_neighbours(self.coords, min(k_ext or 4 * self.k, self.n - 1))
+        self.neighbors, self.costs = self.extended[:, :self.k], distances[:, :self.k]
+        self.heuristic = 1.0 / (self.costs + np.finfo(float).eps)
+        self.pheromone = np.full((self.n, self.k), tau0, dtype=float)
+
+        # Grid: node cell_nodes[cell_start[c]:cell_start[c + 1]] lie in cell c = ix * grid[1] + iy
+        low, span = self.coords.min(axis=0), np.ptp(self.coords, axis=0)
+        self.cell_size = (span.max() or 1.0) / max(1, int(np.sqrt(self.n / 2)))
+        self.cell_xy = np.floor((self.coords - low) / self.cell_size).astype(np.intp)
+        self.grid = self.cell_xy.max(axis=0) + 1
+        self.cell = self.cell_xy[:, 0] * self.grid[1] + self.cell_xy[:, 1]
+        self.cell_nodes = np.argsort(self.cell, kind="stable")
+        self.cell_start = np.concatenate(([0], np.cumsum(np.bincount(self.cell, minlength=self.grid.prod()))))
+
+def nearest_unvisited(graph, visited, remaining, ants, nodes):
+    """Nearest unvisited node of each ant, by growing rings of grid cells around its current node.
+
+    remaining[ant, cell] counts the ant's unvisited nodes per cell, so empty
+    cells are skipped without reading their nodes; a query stops at the
+    first ring beyond its best distance. All ants are searched together.
+    """
+    best = np.full(len(ants), -1)
+    best_d2 = np.full(len(ants), np.inf)
+    active = np.arange(len(ants))
+    r = 0
+    while len(active):
+        cells_xy = graph.cell_xy[nodes[active], None, :] + ring_offsets(r)
+        inside = np.all((cells_xy >= 0) & (cells_xy < graph.grid), axis=2)
+        query, slot = np.nonzero(inside)
+        query = active[query]
+        cells = cells_xy[inside] @ np.array([graph.grid[1], 1])
+        occupied = remaining[ants[query], cells] > 0
+        query, cells = query[occupied], cells[occupied]
+
+        # Every node of the occupied cells, tagged with its query
+        counts = graph.cell_start[cells + 1] - graph.cell_start[cells]
+        owner = np.repeat(np.arange(len(cells)), counts)
+        offset = np.arange(owner.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        found = graph.cell_nodes[graph.cell_start[cells][owner] + offset]
+        query = query[owner]
+        free = ~visited[ants[query], found]
+        query, found = query[free], found[free]
+        d2 = np.sum((graph.coords[found] - graph.coords[nodes[query]]) ** 2, axis=1)
+
+        order = np.lexsort((d2, query))
+        query, first = np.unique(query[order], return_index=True)
+        closer = d2[order][first] < best_d2[query]
+        best[query[closer]] = found[order][first][closer]
+        best_d2[query[closer]] = d2[order][first][closer]
+
+        # Cells beyond ring r are at least r * cell_size away
+        active = active[best_d2[active] > (r * graph.cell_size) ** 2]
+        r += 1
+    return best
+
+def construct_candidate_paths(graph, start, end, n_ants, alpha=ALPHA, beta=BETA, rng=None):
+    """Candidate-list version of construct_colony_paths: each step costs O(k) per ant.
+
+    An ant whose candidates are all visited moves to its nearest unvisited
+    node: the first unvisited entry of graph.extended, or, when those are
+    visited too, a grid search that only reads cells the ant has not
+    emptied. The exhausted ants of a step are handled together.
+    """
+    rng = np.random.default_rng(rng)
+    n = graph.n
+    attractiveness = (graph.pheromone ** alpha) * (graph.heuristic ** beta)
+
+    n_free = n - 1 if start == end else n - 2
+    paths = np.empty((n_ants, n_free + 2), dtype=np.int32)
+    paths[:, 0] = start
+    paths[:, -1] = end
+
+    visited = np.zeros((n_ants, n), dtype=bool)
+    visited[:, start] = True
+    visited[:, end] = True
+    current = np.full(n_ants, start, dtype=np.int32)
+    ants = np.arange(n_ants)
+
+    remaining = np.tile(np.diff(graph.cell_start), (n_ants, 1))
+    for node in {start, end}:
+        remaining[:, graph.cell[node]] -= 1
+
+    for step in range(1, n_free + 1):
+        candidates = graph.neighbors[current]
+        weights = attractiveness[current]
+        weights[visited[ants[:, None], candidates]] = 0.0
+        cumulative = np.cumsum(weights, axis=1)
+
+        r = (1.0 - rng.random(n_ants)) * cumulative[:, -1]
+        slot = np.argmax(cumulative >= r[:, None], axis=1)
+        next_nodes = candidates[ants, slot]
+
+        # All candidates visited: first unvisited node of the extended list
+        exhausted = np.flatnonzero(~(cumulative[:, -1] > 0))
+        if len(exhausted):
+            extended = graph.extended[current[exhausted]]
+            free = ~visited[exhausted[:, None], extended]
+            found = free.any(axis=1)
+            next_nodes[exhausted[found]] = extended[found, np.argmax(free[found], axis=1)]
+
+            # Extended list visited too: grid search
+            far = exhausted[~found]
+            if len(far):
+                next_nodes[far] = nearest_unvisited(graph, visited, remaining, far, current[far])
+
+        paths[:, step] = next_nodes
+        visited[ants, next_nodes] = True
+        remaining[ants, graph.cell[next_nodes]] -= 1
+        current = next_nodes
+
+    return paths
+
+def calculate_candidate_costs(graph, paths):
+    """Calculates the Euclidean length of every path in an (n_ants, length) array."""
+    return np.linalg.norm(np.diff(graph.coords[paths], axis=1), axis=2).sum(axis=1)
+
+def update_pheromone_candidates(graph, paths, costs, rho, Q):
+    """Evaporation and symmetric deposition restricted to candidate edges."""
+    graph.pheromone *= (1.0 - rho)
+
+    costs = np.asarray(costs, dtype=float)
+    delta_tau = np.divide(Q, costs, out=np.zeros_like(costs), where=costs > 0)
+    # Each edge in both directions, ant by ant
+    a = np.concatenate((paths[:, :-1], paths[:, 1:]), axis=1).ravel()
+    b = np.concatenate((paths[:, 1:], paths[:, :-1]), axis=1).ravel()
+    deposits = np.repeat(delta_tau, 2 * (paths.shape[1] - 1))
+
+    # Edges that are not in a's candidate row carry no pheromone and are skipped
+    match = graph.neighbors[a] == b[:, None]
+    hit = match.any(axis=1)
+    np.add.at(graph.pheromone, (a[hit], match[hit].argmax(axis=1)), deposits[hit])
+
+    return graph.pheromone
+
+def run_candidate_colony(graph, start, end, n_ants, n_iter, alpha=ALPHA, beta=BETA, rho=RHO, Q=Q,
+                         checkpoint=None, resume=None, rng=None, termination=None):
+    """Runs n_iter colony iterations on a CandidateGraph; returns (best_path, best_cost).
+
+    Checkpoints hold the graph's (n, k) pheromone rows and the best tour;
+    termination works as in run_colony.
+    """
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    best_path, best_cost, first = None, float("inf"), 0
+    if resume is not None:
+        graph.pheromone[:] = resume["pheromone"]
+        best_path, best_cost, first = resume.get("best_path"), resume["best_cost"], resume["iteration"]
+
+    for it in range(first, n_iter):
+        paths = construct_candidate_paths(graph, start, end, n_ants, alpha, beta, rng)
+        costs = calculate_candidate_costs(graph, paths)
+
+        best_ant = np.argmin(costs)
+        if costs[best_ant] < best_cost:
+            best_cost = costs[best_ant]
+            best_path = paths[best_ant].copy()
+
+        update_pheromone_candidates(graph, paths, costs, rho, Q)
+        if checkpoint is not None:
+            checkpoint.save(it + 1, {"pheromone": graph.pheromone, "best_path": best_path, "best_cost": best_cost}, rng)
+        if termination is not None and termination.update(it, best_cost, None, (it + 1) * n_ants):
+            break
+
+    return best_path, best_cost
+
+# --- 2d. MULTI-COLONY (process-parallel colonies with pheromone merging) ---
+
+# Shared-memory views attached once per worker process by init_colony_worker
+worker_state = {}
+
+def init_colony_worker(pheromone_name, cost_name, n_colonies, n):
+    pheromone_shm = shared_memory.SharedMemory(name=pheromone_name)
+    cost_shm = shared_memory.SharedMemory(name=cost_name)
+    worker_state["shm"] = (pheromone_shm, cost_shm)
+    worker_state["pheromone"] = np.ndarray((n_colonies, n, n), dtype=float, buffer=pheromone_shm.buf)
+    worker_state["cost"] = np.ndarray((n, n), dtype=float, buffer=cost_shm.buf)
+
+def colony_stream(entropy, colony, epoch):
+    """Random stream of one colony for one epoch; depends only on (entropy, colony, epoch), not on scheduling."""
+    return np.random.SeedSequence(entropy, spawn_key=(colony, epoch))
+
+def run_colony_epoch(task):
+    """Runs one colony for one epoch in place on its shared pheromone matrix."""
+    colony, stream, start, end, n_ants, n_iter, alpha, beta, rho, Q = task
+    pheromone_mat = worker_state["pheromone"][colony]
+    best_path, best_cost, _ = run_colony(worker_state["cost"], pheromone_mat, start, end,
+                                         n_ants, n_iter, alpha, beta, rho, Q, rng=np.random.default_rng(stream))
+    return best_path, best_cost
+
+def merge_colonies(pheromones, best_path, best_cost, merge, blend, Q):
+    """Exchanges information between colonies after an epoch.
+
+    merge="blend": every matrix moves `blend` of the way towards the colony mean.
+    merge="best":  the best tour found so far is deposited on every matrix.
+    """
+    if merge == "blend":
+        mean = pheromones.mean(axis=0)
+        pheromones *= (1.0 - blend)
+        pheromones += blend * mean
+    elif merge == "best":
+        for pheromone_mat in pheromones:
+            update_pheromone_colony(pheromone_mat, best_path[None, :], [best_cost], 0.0, Q)
+    else:
+        raise ValueError(f"Unknown merge mode: {merge!r}")
+
+def run_multi_colony(cost_mat, start, end, n_colonies=4, n_ants=50, n_iter=100, exchange_every=10,
+                     merge="blend", blend=0.5, pheromone_mat=None, seed=None, processes=None,
+                     alpha=ALPHA, beta=BETA, rho=RHO, Q=Q, checkpoint=None, resume=None):
+    """Runs independent colonies in a process pool and merges them every `exchange_every` iterations.
+
+    Each colony has its own pheromone matrix in one shared-memory block, so
+    workers update it in place and nothing but the best tours is pickled.
+    Colony streams depend only on (seed, colony, epoch), so a fixed seed gives
+    the same result for any number of processes. For the same reason a
+    checkpoint (saved after every merge, iteration = epochs done) needs no
+    generator state besides the seed entropy.
+    Returns (best_path, best_cost, pheromones) where pheromones is (n_colonies, n, n).
+    """
+    cost_mat = np.asarray(cost_mat, dtype=float)
+    n = cost_mat.shape[0]
+    if pheromone_mat is None:
+        pheromone_mat = np.ones((n, n))
+        np.fill_diagonal(pheromone_mat, 0.0)
+    entropy = np.random.SeedSequence(seed).entropy if resume is None else int(resume["entropy"])
+
+    pheromone_shm = shared_memory.SharedMemory(create=True, size=n_colonies * n * n * 8)
+    cost_shm = shared_memory.SharedMemory(create=True, size=n * n * 8)
+    try:
+        pheromones = np.ndarray((n_colonies, n, n), dtype=float, buffer=pheromone_shm.buf)
+        pheromones[:] = pheromone_mat
+        np.ndarray((n, n), dtype=float, buffer=cost_shm.buf)[:] = cost_mat
+
+        best_path, best_cost, first_epoch = None, float("inf"), 0
+        if resume is not None:
+            pheromones[:] = resume["pheromones"]
+            best_path, best_cost, first_epoch = resume.get("best_path"), resume["best_cost"], resume["iteration"]
+
+        with Pool(processes, initializer=init_colony_worker,
+                  initargs=(pheromone_shm.name, cost_shm.name, n_colonies, n)) as pool:
+            for epoch, done in enumerate(range(0, n_iter, exchange_every)):
+                if epoch < first_epoch:
+                    continue
+                epoch_iter = min(exchange_every, n_iter - done)
+                tasks = [(colony, colony_stream(entropy, colony, epoch), start, end, n_ants, epoch_iter,
+                          alpha, beta, rho, Q) for colony in range(n_colonies)]
+
+                for path, cost in pool.map(run_colony_epoch, tasks):
+                    if cost < best_cost:
+                        best_path, best_cost = path, cost
+
+                merge_colonies(pheromones, best_path, best_cost, merge, blend, Q)
+                if checkpoint is not None:
+                    # The entropy can exceed 64 bits, so it is stored as text
+                    checkpoint.save(epoch + 1, {"pheromones": pheromones, "best_path": best_path,
+                                                "best_cost": best_cost, "entropy": str(entropy)})
+
+        return best_path, best_cost, pheromones.copy()
+    finally:
+        pheromone_shm.close()
+        pheromone_shm.unlink()
+        cost_shm.close()
+        cost_shm.unlink()
+
 # --- 3. SIMULATION EXECUTION ---
 
-# Store paths and costs for update
-paths_costs_A1_A3 = []
+if __name__ == "__main__":
+    print("--- Ant Colony Optimization Setup (4 Cities) ---")
+    print(f"Places: {', '.join(PLACES)}. Start: {PLACES[start_node]}, End: {PLACES[end_node]}.")
+    print("\nCOST MATRIX (Fixed):")
+    print(COST_MATRIX)
+
+    # User-Input for Initial Pheromone Matrix
+    PHEROMONE_MATRIX = read_pheromone_matrix()
+
+    print(f"\nParameters: Alpha={ALPHA}, Beta={BETA}, Q={Q}, Rho={RHO}")
+    print("-" * 50)
+
+    # Store paths and costs for update
+    paths_costs_A1_A3 = []
+    rng = np.random.default_rng()
 
-# 3a. Ants A1, A2, A3 Follow Paths (Using the user's initial pheromone matrix)
-print("\n1. Paths of Ants A1, A2, A3 (Based on your initial pheromone):")
-for ant_label in ['A1', 'A2', 'A3']:
-    path = find_ant_path(start_node, end_node, PHEROMONE_MATRIX, HEURISTIC_MATRIX)
-    cost = calculate_path_cost(path, COST_MATRIX)
+    # 3a. Ants A1, A2, A3 Follow Paths (Using the user's initial pheromone matrix)
+    print("\n1. Paths of Ants A1, A2, A3 (Based on your initial pheromone):")
+    for ant_label in ['A1', 'A2', 'A3']:
+        path = find_ant_path(start_node, end_node, PHEROMONE_MATRIX, HEURISTIC_MATRIX, rng)
+        cost = calculate_path_cost(path, COST_MATRIX)
     
-    paths_costs_A1_A3.append((path, cost))
+        paths_costs_A1_A3.append((path, cost))
     
-    path_labels = [PLACES[n] for n in path]
-    print(f"  Ant {ant_label}: {' -> '.join(path_labels)} (Cost: {cost:.2f})")
+        path_labels = [PLACES[n] for n in path]
+        print(f"  Ant {ant_label}: {' -> '.join(path_labels)} (Cost: {cost:.2f})")
 
-# 3b. Update Pheromone Matrix based on A1, A2, A3
-PHEROMONE_MATRIX = update_pheromone_matrix(PHEROMONE_MATRIX, paths_costs_A1_A3, RHO, Q)
+    # 3b. Update Pheromone Matrix based on A1, A2, A3
+    PHEROMONE_MATRIX = update_pheromone_matrix(PHEROMONE_MATRIX, paths_costs_A1_A3, RHO, Q)
 
-print("-" * 50)
-print("2. Pheromone Matrix After A1, A2, A3 Update (Accumulated Pheromone):")
-print(np.round(PHEROMONE_MATRIX, 4))
-print("-" * 50)
+    print("-" * 50)
+    print("2. Pheromone Matrix After A1, A2, A3 Update (Accumulated Pheromone):")
+    print(np.round(PHEROMONE_MATRIX, 4))
+    print("-" * 50)
 
-# 3c. Ant A4 Follows Path (Using the new, updated matrix)
-print("3. Ant A4 Follows Path:")
-ant_a4_label = 'A4'
-ant_a4_path = find_ant_path(start_node, end_node, PHEROMONE_MATRIX, HEURISTIC_MATRIX)
-ant_a4_cost = calculate_path_cost(ant_a4_path, COST_MATRIX)
+    # 3c. Ant A4 Follows Path (Using the new, updated matrix)
+    print("3. Ant A4 Follows Path:")
+    ant_a4_label = 'A4'
+    ant_a4_path = find_ant_path(start_node, end_node, PHEROMONE_MATRIX, HEURISTIC_MATRIX, rng)
+    ant_a4_cost = calculate_path_cost(ant_a4_path, COST_MATRIX)
 
-ant_a4_path_labels = [PLACES[n] for n in ant_a4_path]
+    ant_a4_path_labels = [PLACES[n] for n in ant_a4_path]
 
-print(f"  Ant {ant_a4_label} **will follow** the path: **{' -> '.join(ant_a4_path_labels)}** (Cost: {ant_a4_cost:.2f})")
+    print(f"  Ant {ant_a4_label} **will follow** the path: **{' -> '.join(ant_a4_path_labels)}** (Cost: {ant_a4_cost:.2f})")
 
-# 3d. Update Pheromone Matrix based on A4
-# This is the "after the 4th ant the pheromone level should change" step
-PHEROMONE_MATRIX = update_pheromone_matrix(PHEROMONE_MATRIX, [(ant_a4_path, ant_a4_cost)], RHO, Q)
+    # 3d. Update Pheromone Matrix based on A4
+    # This is the "after the 4th ant the pheromone level should change" step
+    PHEROMONE_MATRIX = update_pheromone_matrix(PHEROMONE_MATRIX, [(ant_a4_path, ant_a4_cost)], RHO, Q)
 
-print("-" * 50)
-print("4. Pheromone Matrix After A4 Update (Final Change):")
-print(np.round(PHEROMONE_MATRIX, 4))
\ No newline at end of file
+    print("-" * 50)
+    print("4. Pheromone Matrix After A4 Update (Final Change):")
+    print(np.round(PHEROMONE_MATRIX, 4))
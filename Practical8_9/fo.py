@@ -1,7 +1,12 @@
+import asyncio
 import numpy as np
-import random
 import matplotlib.pyplot as plt
 
+try:
+    from rws import check_generator
+except ImportError:  # imported as Practical8_9.fo from the repository root
+    from Practical8_9.rws import check_generator
+
 # Function to optimize
 def fitness_function(x):
     return x * np.sin(10 * np.pi * x) + 2.0
@@ -13,54 +18,149 @@ MUT_RATE = 0.1
 CROSS_RATE = 0.8
 X_BOUND = [-1, 2]  # Search space
 
-# Generate initial population
-population = np.random.uniform(X_BOUND[0], X_BOUND[1], POP_SIZE)
+# The operators take rng, the numpy Generator of the run (None: a fresh one)
 
 # Function to select parents (Roulette Wheel Selection)
-def selection(pop, fitness):
+def selection(pop, fitness, size=POP_SIZE, rng=None):
     probs = fitness / np.sum(fitness)
-    idx = np.random.choice(range(POP_SIZE), size=POP_SIZE, p=probs)
+    idx = check_generator(rng).choice(len(pop), size=size, p=probs)
     return pop[idx]
 
 # Crossover operation
-def crossover(parent, pop):
-    if np.random.rand() < CROSS_RATE:
-        i = np.random.randint(0, POP_SIZE)
-        cross_point = np.random.rand()
+def crossover(parent, pop, rng=None):
+    rng = check_generator(rng)
+    if rng.random() < CROSS_RATE:
+        i = rng.integers(0, len(pop))
+        cross_point = rng.random()
         child = cross_point * parent + (1 - cross_point) * pop[i]
         return child
     else:
         return parent
 
 # Mutation operation
-def mutate(child):
-    if np.random.rand() < MUT_RATE:
-        child += np.random.uniform(-0.1, 0.1)
+def mutate(child, rng=None):
+    rng = check_generator(rng)
+    if rng.random() < MUT_RATE:
+        child += rng.uniform(-0.1, 0.1)
     return np.clip(child, X_BOUND[0], X_BOUND[1])
 
-# Main GA loop
-best_scores = []
-for gen in range(GENS):
-    fitness = fitness_function(population)
-    best_idx = np.argmax(fitness)
-    best_scores.append(fitness[best_idx])
+# Wrap a plain fitness function as an async evaluator (runs in an executor,
+# e.g. a ProcessPoolExecutor for expensive simulations)
+def async_evaluator(func, executor=None):
+    async def evaluate(x):
+        return await asyncio.get_running_loop().run_in_executor(executor, func, x)
+    return evaluate
+
+# Asynchronous steady-state GA
+# n_workers evaluations are always in flight: as soon as one finishes, the
+# individual is inserted (replacing the worst once the population is full),
+# a child is bred from the current population with selection/crossover/mutate
+# and submitted, so no worker waits for the slowest evaluation of a generation.
+# The first pop_size submissions are the random initial population; workers
+# beyond that get extra random individuals until something can be bred from.
+# If an evaluation raises, the ones still in flight are cancelled.
+# termination (a common.termination.Termination with maximize=True) is
+# updated after every completed evaluation; once it fires nothing new is
+# submitted and the evaluations already in flight are still inserted.
+async def steady_state_ga(evaluate, n_workers=POP_SIZE, max_evaluations=POP_SIZE * GENS, telemetry=None, rng=None,
+                          termination=None, pop_size=POP_SIZE):
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    population = np.empty(pop_size)
+    fitness = np.empty(pop_size)
+    filled = 0
+    best_scores = np.empty(max_evaluations)  # best fitness after each completed evaluation
+    completed = 0
+
+    initial = rng.uniform(X_BOUND[0], X_BOUND[1], pop_size)
+    pending = {}
+    submitted = 0
+    stopped = False
+
+    def submit():
+        nonlocal submitted
+        if submitted < pop_size:
+            x = initial[submitted]
+        elif filled == 0:
+            x = rng.uniform(X_BOUND[0], X_BOUND[1])  # nothing evaluated yet to breed from
+        else:
+            parent = selection(population[:filled], fitness[:filled], size=1, rng=rng)[0]
+            x = mutate(crossover(parent, population[:filled], rng), rng)
+        pending[asyncio.ensure_future(evaluate(x))] = x
+        submitted += 1
+
+    try:
+        while submitted < min(n_workers, max_evaluations):
+            submit()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                x, f = pending.pop(task), task.result()
+                if filled < pop_size:
+                    population[filled], fitness[filled] = x, f
+                    filled += 1
+                else:
+                    worst = np.argmin(fitness)
+                    if f > fitness[worst]:
+                        population[worst], fitness[worst] = x, f
+                best_scores[completed] = fitness[:filled].max()
+                if telemetry is not None:
+                    telemetry.observe(completed, best_scores[completed], population[:filled], fitness[:filled],
+                                      completed + 1)
+                if termination is not None and not stopped:
+                    stopped = termination.update(completed, best_scores[completed], population[:filled], completed + 1)
+                completed += 1
+
+                if submitted < max_evaluations and not stopped:
+                    submit()
+    finally:
+        # Only non-empty when an evaluation raised
+        for task in pending:
+            task.cancel()
+
+    best_idx = np.argmax(fitness[:filled])
+    return population[best_idx], fitness[best_idx], best_scores[:completed]
+
+if __name__ == "__main__":
+    rng = np.random.default_rng()
+
+    # Generate initial population
+    population = rng.uniform(X_BOUND[0], X_BOUND[1], POP_SIZE)
+
+    # Main GA loop
+    best_scores = np.empty(GENS)
+    for gen in range(GENS):
+        fitness = fitness_function(population)
+        best_idx = np.argmax(fitness)
+        best_scores[gen] = fitness[best_idx]
     
-    selected = selection(population, fitness)
-    new_pop = []
-    for parent in selected:
-        child = crossover(parent, population)
-        child = mutate(child)
-        new_pop.append(child)
-    population = np.array(new_pop)
-
-best_solution = population[np.argmax(fitness_function(population))]
-best_value = np.max(fitness_function(population))
-
-print(f"Optimal x = {best_solution:.4f}, Maximum value f(x) = {best_value:.4f}")
-
-# Plot convergence
-plt.plot(best_scores)
-plt.title("Genetic Algorithm Optimization Progress")
-plt.xlabel("Generation")
-plt.ylabel("Best Fitness Value")
-plt.show()
+        selected = selection(population, fitness, rng=rng)
+        new_pop = []
+        for parent in selected:
+            child = crossover(parent, population, rng)
+            child = mutate(child, rng)
+            new_pop.append(child)
+        population = np.array(new_pop)
+
+    final_fitness = fitness_function(population)
+    best_solution = population[np.argmax(final_fitness)]
+    best_value = np.max(final_fitness)
+
+    print(f"Optimal x = {best_solution:.4f}, Maximum value f(x) = {best_value:.4f}")
+
+    # Plot convergence
+    plt.plot(best_scores)
+    plt.title("Genetic Algorithm Optimization Progress")
+    plt.xlabel("Generation")
+    plt.ylabel("Best Fitness Value")
+    plt.show()
+
+    # Steady-state GA against an evaluation whose time varies 10x
+    async def slow_fitness(x):
+        await asyncio.sleep(rng.uniform(0.001, 0.01))
+        return fitness_function(x)
+
+    ss_solution, ss_value, _ = asyncio.run(steady_state_ga(slow_fitness, rng=rng.spawn(1)[0]))
+    print(f"Steady-state GA: Optimal x = {ss_solution:.4f}, Maximum value f(x) = {ss_value:.4f}")
@@ -1,9 +1,16 @@
-import random
+import numpy as np
+
+try:
+    from rws import check_generator
+except ImportError:  # imported as Practical8_9.mut_cross from the repository root
+    from Practical8_9.rws import check_generator
+
+# rng: the caller's numpy Generator (None: a fresh one)
 
 # --- Step 1: Single Point Crossover ---
-def single_point_crossover(parent1, parent2):
+def single_point_crossover(parent1, parent2, rng=None):
     # Random crossover point (not at ends)
-    point = random.randint(1, len(parent1) - 1)
+    point = int(check_generator(rng).integers(1, len(parent1)))
     # Generate two children by swapping segments
     child1 = parent1[:point] + parent2[point:]
     child2 = parent2[:point] + parent1[point:]
@@ -11,15 +18,17 @@ def single_point_crossover(parent1, parent2):
     return child1, child2
 
 # --- Step 2: Bit Flip Mutation ---
-def bit_flip_mutation(chromosome, mutation_rate=0.2):
-    mutated = ""
-    for gene in chromosome:
-        if random.random() < mutation_rate:
+def bit_flip_mutation(chromosome, mutation_rate=0.2, rng=None):
+    # Collect genes in a list and join once (repeated string += is quadratic);
+    # the random numbers for all genes are drawn in one block
+    mutated = []
+    for gene, r in zip(chromosome, check_generator(rng).random(len(chromosome))):
+        if r < mutation_rate:
             # Flip bit: 0 → 1, 1 → 0
-            mutated += '1' if gene == '0' else '0'
+            mutated.append('1' if gene == '0' else '0')
         else:
-            mutated += gene
-    return mutated
+            mutated.append(gene)
+    return "".join(mutated)
 
 # --- MAIN PROGRAM ---
 if __name__ == "__main__":
@@ -1,6 +1,10 @@
-import random
 import numpy as np
 
+try:
+    from rws import check_generator, spin_wheel
+except ImportError:  # imported as Practical8_9.pr8 from the repository root
+    from Practical8_9.rws import check_generator, spin_wheel
+
 # -----------------------------------------------
 # Objective Function (to minimize)
 # Example: f(x) = x^2 + 2x + 1
@@ -10,28 +14,32 @@ def objective_function(x):
 
 # -----------------------------------------------
 # Generate initial population (random real numbers)
+# rng is the run's numpy Generator (None: a fresh one); the GA functions
+# also accept a seed
 # -----------------------------------------------
-def initialize_population(pop_size, lower_bound, upper_bound):
-    return [random.uniform(lower_bound, upper_bound) for _ in range(pop_size)]
+def initialize_population(pop_size, lower_bound, upper_bound, rng=None):
+    return list(check_generator(rng).uniform(lower_bound, upper_bound, pop_size))
 
 # -----------------------------------------------
 # Fitness Function (lower function value = higher fitness)
 # Convert minimization → maximization by taking reciprocal
 # -----------------------------------------------
-def fitness(population):
+def fitness(population, objective=objective_function):
     fitness_values = []
     for x in population:
-        f = objective_function(x)
+        f = objective(x)
         fitness_values.append(1 / (1 + f))  # add 1 to avoid divide by zero
     return fitness_values
 
 # -----------------------------------------------
 # Roulette Wheel Selection
+# The scalar operators get their random numbers from genetic_algorithm,
+# which draws them in one block per generation
+# r: the spin, in [0, 1)
 # -----------------------------------------------
-def roulette_wheel_selection(population, fitness_values):
+def roulette_wheel_selection(population, fitness_values, r):
     total_fitness = sum(fitness_values)
     selection_probs = [f / total_fitness for f in fitness_values]
-    r = random.random()
     cumulative = 0
     for i, prob in enumerate(selection_probs):
         cumulative += prob
@@ -41,48 +49,63 @@ def roulette_wheel_selection(population, fitness_values):
 # -----------------------------------------------
 # Crossover (Single Point)
 # -----------------------------------------------
-def crossover(parent1, parent2):
-    alpha = random.random()  # Blend crossover (for real numbers)
+def crossover(parent1, parent2, alpha):
+    # Blend crossover (for real numbers), alpha in [0, 1)
     child1 = alpha * parent1 + (1 - alpha) * parent2
     child2 = alpha * parent2 + (1 - alpha) * parent1
     return child1, child2
 
 # -----------------------------------------------
 # Mutation
+# test in [0, 1) decides whether x mutates, by step in [-1, 1)
 # -----------------------------------------------
-def mutate(x, mutation_rate=0.1):
-    if random.random() < mutation_rate:
-        x += random.uniform(-1, 1)  # small random change
+def mutate(x, test, step, mutation_rate=0.1):
+    if test < mutation_rate:
+        x += step  # small random change
     return x
 
 # -----------------------------------------------
 # Genetic Algorithm Main Function
+# termination: an optional common.termination.Termination that can stop
+# before the last generation
 # -----------------------------------------------
-def genetic_algorithm(pop_size=10, generations=30, lb=-10, ub=10, mutation_rate=0.1):
-    population = initialize_population(pop_size, lb, ub)
+def genetic_algorithm(pop_size=10, generations=30, lb=-10, ub=10, mutation_rate=0.1, objective=objective_function,
+                      telemetry=None, rng=None, termination=None):
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    population = initialize_population(pop_size, lb, ub, rng)
 
     for gen in range(generations):
-        fitness_values = fitness(population)
+        fitness_values = fitness(population, objective)
         new_population = []
 
         # Elitism: keep best individual
         best_index = np.argmax(fitness_values)
         best_individual = population[best_index]
-        best_value = objective_function(best_individual)
+        best_value = 1 / fitness_values[best_index] - 1  # undo fitness = 1 / (1 + f(x)) instead of re-scoring
         new_population.append(best_individual)
 
-        # Create rest of the population
-        while len(new_population) < pop_size:
+        if telemetry is not None:
+            objective_values = [1 / f - 1 for f in fitness_values]
+            telemetry.observe(gen, best_value, population, objective_values, (gen + 1) * pop_size)
+        if termination is not None and termination.update(gen, best_value, population, (gen + 1) * pop_size):
+            break
+
+        # Create rest of the population from one block of random numbers:
+        # per pair two spins and a blend alpha, per child a mutation test and step
+        n_pairs = (pop_size - len(new_population) + 1) // 2
+        for spin1, spin2, alpha, test1, test2, step1, step2 in rng.random((n_pairs, 7)):
             # Selection
-            parent1 = roulette_wheel_selection(population, fitness_values)
-            parent2 = roulette_wheel_selection(population, fitness_values)
+            parent1 = roulette_wheel_selection(population, fitness_values, spin1)
+            parent2 = roulette_wheel_selection(population, fitness_values, spin2)
 
             # Crossover
-            child1, child2 = crossover(parent1, parent2)
+            child1, child2 = crossover(parent1, parent2, alpha)
 
             # Mutation
-            child1 = mutate(child1, mutation_rate)
-            child2 = mutate(child2, mutation_rate)
+            child1 = mutate(child1, test1, 2 * step1 - 1, mutation_rate)
+            child2 = mutate(child2, test2, 2 * step2 - 1, mutation_rate)
 
             # Add children
             new_population.extend([child1, child2])
@@ -90,14 +113,91 @@ def genetic_algorithm(pop_size=10, generations=30, lb=-10, ub=10, mutation_rate=
         # Update population for next generation
         population = new_population[:pop_size]
 
-        print(f"Generation {gen+1}: Best X = {best_individual:.4f}, f(X) = {best_value:.4f}")
-
     # Final result
     print("\n🎯 Optimized Result:")
     print(f"Best X = {best_individual:.4f}")
     print(f"Minimum f(X) = {best_value:.4f}")
 
+# -----------------------------------------------
+# Array-backed GA engine
+# Population is a (pop_size, dim) array; every step works on the whole array
+# -----------------------------------------------
+def batch_objective(population):
+    # Scores every row at once: sum of objective_function over the genes
+    return np.sum(objective_function(population), axis=1)
+
+def batch_fitness(objective_values):
+    return 1 / (1 + objective_values)
+
+def vectorized_roulette_wheel_selection(population, fitness_values, num_parents, rng=None):
+    # Cumulative sums + searchsorted: O(N + Np log N) instead of O(N * Np)
+    cumulative = np.cumsum(fitness_values)
+    return population[spin_wheel(cumulative, num_parents, check_generator(rng))]
+
+def vectorized_crossover(parents1, parents2, rng=None):
+    # Blend crossover with one alpha per pair, as in crossover()
+    alpha = check_generator(rng).random((len(parents1), 1))
+    child1 = alpha * parents1 + (1 - alpha) * parents2
+    child2 = alpha * parents2 + (1 - alpha) * parents1
+    return np.concatenate((child1, child2))
+
+def vectorized_mutate(population, mutation_rate=0.1, rng=None):
+    # Each gene mutates independently with probability mutation_rate
+    rng = check_generator(rng)
+    mask = rng.random(population.shape) < mutation_rate
+    population[mask] += rng.uniform(-1, 1, np.count_nonzero(mask))
+    return population
+
+def vectorized_genetic_algorithm(pop_size=10, generations=30, lb=-10, ub=10, mutation_rate=0.1,
+                                 dim=1, objective=batch_objective, telemetry=None, checkpoint=None, resume=None,
+                                 rng=None, termination=None):
+    # objective(population) must return a (pop_size,) array of values to minimize
+    if generations < 1:
+        raise ValueError(f"generations must be at least 1, got {generations}")
+    rng = np.random.default_rng(rng)
+    if termination is not None:
+        termination.reset()
+    if resume is None:
+        population, start = rng.uniform(lb, ub, (pop_size, dim)), 0
+    else:
+        # Continue a checkpointed run from its saved population
+        population, start = np.array(resume["population"]), resume["iteration"]
+        best_individual, best_value = np.array(resume["best_individual"]), resume["best_value"]
+    n_pairs = pop_size // 2  # pop_size - 1 children plus the elite
+
+    for gen in range(start, generations):
+        objective_values = objective(population)
+        fitness_values = batch_fitness(objective_values)
+
+        # Elitism: keep best individual
+        best_index = np.argmax(fitness_values)
+        best_individual = population[best_index].copy()
+        best_value = objective_values[best_index]
+        if telemetry is not None:
+            telemetry.observe(gen, best_value, population, objective_values, (gen + 1) * pop_size)
+
+        # Selection, crossover and mutation for the whole population at once
+        parents = vectorized_roulette_wheel_selection(population, fitness_values, 2 * n_pairs, rng)
+        children = vectorized_crossover(parents[:n_pairs], parents[n_pairs:], rng)
+        children = vectorized_mutate(children, mutation_rate, rng)
+
+        # Update population for next generation (scored keeps the one just scored)
+        scored, population = population, np.concatenate((best_individual[None, :], children[:pop_size - 1]))
+        if checkpoint is not None:
+            checkpoint.save(gen + 1, {"population": population, "best_individual": best_individual,
+                                      "best_value": best_value}, rng)
+        if termination is not None and termination.update(gen, best_value, scored, (gen + 1) * pop_size):
+            break
+
+    return best_individual, best_value
+
 # -----------------------------------------------
 # Run GA
 # -----------------------------------------------
-genetic_algorithm()
+if __name__ == "__main__":
+    genetic_algorithm()
+
+    best_individual, best_value = vectorized_genetic_algorithm(pop_size=50, generations=100, dim=2, rng=1)
+    print("\n🎯 Vectorized Result (pop_size=50, dim=2):")
+    print(f"Best X = {best_individual}")
+    print(f"Minimum f(X) = {best_value:.4f}")
@@ -1,7 +1,13 @@
-import random
+import numpy as np
+
+try:
+    from rws import check_generator
+except ImportError:  # imported as Practical8_9.pr9 from the repository root
+    from Practical8_9.rws import check_generator
 
 # ---------------------------------------
 # Helper functions
+# Random steps take rng, the run's numpy Generator (None: a fresh one)
 # ---------------------------------------
 
 # Fitness function: count of 1's in chromosome
@@ -9,13 +15,12 @@ def fitness(chromosome):
     return sum(chromosome)
 
 # Roulette Wheel Selection
-def roulette_wheel_selection(population, fitness_values, num_parents):
+def roulette_wheel_selection(population, fitness_values, num_parents, rng=None):
     total_fitness = sum(fitness_values)
     selection_probs = [f / total_fitness for f in fitness_values]
 
     selected_parents = []
-    for _ in range(num_parents):
-        r = random.random()
+    for r in check_generator(rng).random(num_parents):
         cumulative = 0
         for i, prob in enumerate(selection_probs):
             cumulative += prob
@@ -25,58 +30,164 @@ def roulette_wheel_selection(population, fitness_values, num_parents):
     return selected_parents
 
 # Single-point Crossover
-def single_point_crossover(parent1, parent2):
-    point = random.randint(1, len(parent1) - 1)
+def single_point_crossover(parent1, parent2, rng=None):
+    point = int(check_generator(rng).integers(1, len(parent1)))
     child1 = parent1[:point] + parent2[point:]
     child2 = parent2[:point] + parent1[point:]
     return child1, child2
 
 # Bit-flip Mutation
-def bit_flip_mutation(chromosome, mutation_rate=0.1):
+def bit_flip_mutation(chromosome, mutation_rate=0.1, rng=None):
     mutated = []
-    for gene in chromosome:
-        if random.random() < mutation_rate:
+    for gene, r in zip(chromosome, check_generator(rng).random(len(chromosome))):
+        if r < mutation_rate:
             mutated.append(1 - gene)  # flip 0↔1
         else:
             mutated.append(gene)
     return mutated
 
+# ---------------------------------------
+# Bit-packed population
+# ---------------------------------------
+
+WORD_BITS = 64
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Popcount per uint64 word (np.bitwise_count needs NumPy >= 2.0)
+if hasattr(np, "bitwise_count"):
+    def popcount(words):
+        return np.bitwise_count(words)
+else:
+    BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(words):
+        counts = BYTE_POPCOUNT[words.view(np.uint8)]
+        return counts.reshape(*words.shape, 8).sum(axis=-1)
+
+class PackedPopulation:
+    """Binary population stored as a (pop_size, ceil(n_bits / 64)) uint64 bit matrix.
+
+    Gene i of a chromosome is bit i % 64 of word i // 64; padding bits in the
+    last word are always zero. Every operator works on whole words, so a
+    100k-bit chromosome costs 12.5 kB instead of 100k Python ints.
+    """
+
+    def __init__(self, words, n_bits):
+        self.words = np.ascontiguousarray(words, dtype=np.uint64)
+        self.n_bits = n_bits
+
+    @classmethod
+    def from_lists(cls, population):
+        bits = np.asarray(population, dtype=np.uint8)
+        n_bits = bits.shape[1]
+        n_words = -(-n_bits // WORD_BITS)
+        packed = np.zeros((len(bits), n_words * 8), dtype=np.uint8)
+        packed[:, :-(-n_bits // 8)] = np.packbits(bits, axis=1, bitorder="little")
+        return cls(packed.view("<u8").astype(np.uint64), n_bits)
+
+    @classmethod
+    def random(cls, pop_size, n_bits, rng=None):
+        n_words = -(-n_bits // WORD_BITS)
+        words = check_generator(rng).integers(0, 2**64, (pop_size, n_words), dtype=np.uint64)
+        words[:, -1] &= cls.low_bits_mask(n_bits - (n_words - 1) * WORD_BITS)
+        return cls(words, n_bits)
+
+    @staticmethod
+    def low_bits_mask(k):
+        # Word with the lowest k bits set (0 <= k <= 64)
+        k = np.asarray(k, dtype=np.uint64)
+        return np.where(k >= WORD_BITS, ALL_ONES, (np.uint64(1) << (k % np.uint64(WORD_BITS))) - np.uint64(1))
+
+    def to_lists(self):
+        bits = np.unpackbits(self.words.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+        return bits[:, :self.n_bits].tolist()
+
+    def fitness(self):
+        # Count of 1's in every chromosome (OneMax)
+        return popcount(self.words).sum(axis=1, dtype=np.int64)
+
+    def single_point_crossover(self, parents1, parents2, rng=None):
+        """Crosses rows parents1[i] and parents2[i] at one random point each; returns 2 * len(parents1) children."""
+        p1, p2 = self.words[parents1], self.words[parents2]
+        points = check_generator(rng).integers(1, self.n_bits, len(p1))
+
+        # Bits below the crossover point come from the first parent
+        word_start = np.arange(self.words.shape[1]) * WORD_BITS
+        mask = self.low_bits_mask(np.clip(points[:, None] - word_start[None, :], 0, WORD_BITS))
+
+        child1 = (p1 & mask) | (p2 & ~mask)
+        child2 = (p2 & mask) | (p1 & ~mask)
+        return PackedPopulation(np.concatenate((child1, child2)), self.n_bits)
+
+    def uniform_crossover(self, parents1, parents2, rng=None):
+        """Every bit comes from either parent with probability 0.5; returns 2 * len(parents1) children."""
+        p1, p2 = self.words[parents1], self.words[parents2]
+        mask = check_generator(rng).integers(0, 2**64, p1.shape, dtype=np.uint64)
+        child1 = (p1 & mask) | (p2 & ~mask)
+        child2 = (p2 & mask) | (p1 & ~mask)
+        return PackedPopulation(np.concatenate((child1, child2)), self.n_bits)
+
+    def bit_flip_mutation(self, mutation_rate=0.1, rng=None):
+        """Flips every bit independently with probability mutation_rate (in place, by XOR)."""
+        pop_size, n_words = self.words.shape
+        total_bits = pop_size * self.n_bits
+        if mutation_rate <= 0 or total_bits == 0:
+            return self
+
+        # Geometric gaps between flipped bits give an exact Bernoulli process
+        # while only drawing one random number per flipped bit
+        rng = check_generator(rng)
+        expected = total_bits * mutation_rate
+        gaps = rng.geometric(mutation_rate, int(expected + 6 * np.sqrt(expected) + 16))
+        positions = np.cumsum(gaps) - 1
+        while positions[-1] < total_bits:
+            more = np.cumsum(rng.geometric(mutation_rate, len(gaps))) + positions[-1]
+            positions = np.concatenate((positions, more))
+        positions = positions[positions < total_bits]
+
+        rows, bits = np.divmod(positions, self.n_bits)
+        flips = np.uint64(1) << (bits % WORD_BITS).astype(np.uint64)
+        flat = self.words.reshape(-1)
+        np.bitwise_xor.at(flat, rows * n_words + bits // WORD_BITS, flips)
+        return self
+
 # ---------------------------------------
 # Main Demonstration
 # ---------------------------------------
 
-# Sample binary population (4 individuals, each of length 6)
-population = [
-    [1, 0, 1, 1, 0, 1],
-    [0, 1, 1, 0, 0, 0],
-    [1, 1, 0, 1, 1, 0],
-    [0, 0, 1, 1, 0, 1]
-]
-
-print("Initial Population:")
-for p in population:
-    print(p)
-
-# Step : Fitness Evaluation
-fitness_values = [fitness(p) for p in population]
-print("\nFitness of each individual:", fitness_values)
-
-# Step : Selection (Roulette Wheel)
-parents = roulette_wheel_selection(population, fitness_values, num_parents=2)
-print("\nSelected Parents (via Roulette Wheel):")
-for p in parents:
-    print(p)
-
-# Step : Crossover
-child1, child2 = single_point_crossover(parents[0], parents[1])
-print(f"\nCrossover between {parents[0]} and {parents[1]}")
-print("Generated Children:")
-print("Child 1:", child1)
-print("Child 2:", child2)
-
-# Step : Mutation
-mutated_child1 = bit_flip_mutation(child1, mutation_rate=0.2)
-mutated_child2 = bit_flip_mutation(child2, mutation_rate=0.2)
-print("\nAfter Mutation (bit-flip with 0.2 rate):")
-print("Mutated Child 1:", mutated_child1)
-print("Mutated Child 2:", mutated_child2)
+if __name__ == "__main__":
+    # Sample binary population (4 individuals, each of length 6)
+    population = [
+        [1, 0, 1, 1, 0, 1],
+        [0, 1, 1, 0, 0, 0],
+        [1, 1, 0, 1, 1, 0],
+        [0, 0, 1, 1, 0, 1]
+    ]
+
+    print("Initial Population:")
+    for p in population:
+        print(p)
+
+    # Step : Fitness Evaluation
+    fitness_values = [fitness(p) for p in population]
+    print("\nFitness of each individual:", fitness_values)
+
+    # Step : Selection (Roulette Wheel)
+    parents = roulette_wheel_selection(population, fitness_values, num_parents=2)
+    print("\nSelected Parents (via Roulette Wheel):")
+    for p in parents:
+        print(p)
+
+    # Step : Crossover
+    child1, child2 = single_point_crossover(parents[0], parents[1])
+    print(f"\nCrossover between {parents[0]} and {parents[1]}")
+    print("Generated Children:")
+    print("Child 1:", child1)
+    print("Child 2:", child2)
+
+    # Step : Mutation
+    mutated_child1 = bit_flip_mutation(child1, mutation_rate=0.2)
+    mutated_child2 = bit_flip_mutation(child2, mutation_rate=0.2)
+    print("\nAfter Mutation (bit-flip with 0.2 rate):")
+    print("Mutated Child 1:", mutated_child1)
+    print("Mutated Child 2:", mutated_child2)
@@ -1,6 +1,12 @@
-import random
+from functools import lru_cache
+import numpy as np
 
-def rank_based_selection(population_size, num_parents_to_select, fitness_values):
+try:
+    from rws import check_generator, spin_wheel
+except ImportError:  # imported as Practical8_9.rbs from the repository root
+    from Practical8_9.rws import check_generator, spin_wheel
+
+def rank_based_selection(population_size, num_parents_to_select, fitness_values, rng=None):
     """
     Implements the Rank-Based Selection method for Genetic Algorithms.
 
@@ -8,6 +14,7 @@ def rank_based_selection(population_size, num_parents_to_select, fitness_values)
         population_size (int): The total number of individuals in the current population (N).
         num_parents_to_select (int): The number of individuals to select as parents (Np).
         fitness_values (list): A list of fitness scores for each individual.
+        rng (np.random.Generator): Random generator; a fresh one if None.
 
     Returns:
         list: A list of selected parent labels (e.g., 'A', 'B', 'C', ...) 
@@ -63,8 +70,7 @@ def rank_based_selection(population_size, num_parents_to_select, fitness_values)
 
     # 8. Select Parents using the "Rank Wheel"
     selected_parents = []
-    for _ in range(num_parents_to_select):
-        r = random.random() # Spin the Rank Wheel
+    for r in check_generator(rng).random(num_parents_to_select): # Spin the Rank Wheel (all spins in one block)
         
         # Determine which rank slice 'r' falls into
         for i, cum_p in enumerate(cumulative_probabilities):
@@ -77,53 +83,154 @@ def rank_based_selection(population_size, num_parents_to_select, fitness_values)
 
     return selected_parents
 
-# --- User Input Section ---
-print("--- Genetic Algorithm: Rank-Based Selection ---")
-while True:
-    try:
-        N = int(input("Enter the total population size (N): "))
-        if N <= 0: raise ValueError
-        break
-    except ValueError:
-        print("Invalid input. Please enter a positive integer for N.")
-
-while True:
-    try:
-        Np = int(input(f"Enter the number of parents to select (Np <= {N}): "))
-        if Np <= 0 or Np > N: raise ValueError
-        break
-    except ValueError:
-        print(f"Invalid input. Please enter a positive integer for Np, less than or equal to N ({N}).")
-
-# Input Fitness Values
-print(f"\nEnter the fitness value for each of the {N} individuals:")
-fitness_input = []
-original_labels_map = {}
-for i in range(N):
+@lru_cache(maxsize=8)
+def rank_wheel(population_size, scheme="linear", pressure=None):
+    """
+    Builds the cumulative "Rank Wheel" for rank positions 0 (best) .. N-1 (worst).
+
+    The wheel depends only on (N, scheme, pressure), never on the fitness
+    values, so it is cached and reused across generations. A run uses one
+    or two wheels, so the cache keeps only the last few (each holds N floats).
+
+    Args:
+        population_size (int): The total number of individuals (N).
+        scheme (str): "linear" or "exponential".
+        pressure (float): Linear: selection pressure s in [1, 2] (Baker's ranking);
+                          None keeps the rank fitness N, N-1, ..., 1 used above.
+                          Exponential: base c in (0, 1), rank i gets weight c**i (default 0.9).
+
+    Returns:
+        np.ndarray: Read-only cumulative probabilities of length N.
+
+    Raises:
+        ValueError: If pressure is outside the scheme's range (it would give
+            negative or non-decreasing weights).
+    """
+    ranks = np.arange(population_size, dtype=float)
+    if scheme == "linear":
+        if pressure is None:
+            weights = population_size - ranks
+        else:
+            if not 1.0 <= pressure <= 2.0:
+                raise ValueError(f"Linear ranking needs 1 <= pressure <= 2, got {pressure}")
+            slope = 2.0 * (pressure - 1.0) / max(population_size - 1, 1)
+            weights = (2.0 - pressure) + slope * (population_size - 1 - ranks)
+    elif scheme == "exponential":
+        if pressure is not None and not 0.0 < pressure < 1.0:
+            raise ValueError(f"Exponential ranking needs 0 < pressure < 1, got {pressure}")
+        weights = (0.9 if pressure is None else pressure) ** ranks
+    else:
+        raise ValueError(f"Unknown ranking scheme: {scheme!r}")
+
+    cumulative_probabilities = np.cumsum(weights / weights.sum())
+    cumulative_probabilities.flags.writeable = False
+    return cumulative_probabilities
+
+def vectorized_rank_based_selection(fitness_values, num_parents_to_select, scheme="linear", pressure=None, rng=None):
+    """
+    Rank-Based Selection with a cached Rank Wheel and one vectorized spin.
+
+    Rank positions are drawn first; only the individuals up to the worst
+    drawn position need to be ordered, which argpartition does in O(N).
+
+    Args:
+        fitness_values (list): A list of fitness scores for each individual.
+        num_parents_to_select (int): The number of individuals to select as parents (Np).
+        scheme (str): "linear" or "exponential" (see rank_wheel).
+        pressure (float): Selection pressure for the chosen scheme.
+        rng (np.random.Generator): Random generator; a fresh one if None.
+
+    Returns:
+        np.ndarray: Original indices of the selected parents.
+    """
+    rng = check_generator(rng)
+    if num_parents_to_select == 0:
+        return np.empty(0, dtype=np.intp)
+    fitness_values = np.asarray(fitness_values, dtype=float)
+    population_size = len(fitness_values)
+    cumulative_probabilities = rank_wheel(population_size, scheme, pressure)
+
+    # 1. Spin the Rank Wheel for every parent at once
+    positions = spin_wheel(cumulative_probabilities, num_parents_to_select, rng)
+
+    # 2. Order only the top (worst drawn position + 1) individuals, highest fitness first
+    top = positions.max() + 1
+    if top < population_size:
+        candidates = np.argpartition(-fitness_values, top - 1)[:top]
+    else:
+        candidates = np.arange(population_size)
+    original_indices = candidates[np.argsort(-fitness_values[candidates], kind="stable")]
+
+    # 3. Map rank positions back to the original individuals
+    return original_indices[positions]
+
+def tournament_selection(fitness_values, num_parents_to_select, k=2, rng=None):
+    """
+    k-way Tournament Selection: each parent is the fittest of k random individuals.
+
+    Args:
+        fitness_values (list): A list of fitness scores for each individual.
+        num_parents_to_select (int): The number of individuals to select as parents (Np).
+        k (int): Tournament size.
+        rng (np.random.Generator): Random generator; a fresh one if None.
+
+    Returns:
+        np.ndarray: Original indices of the selected parents.
+    """
+    fitness_values = np.asarray(fitness_values, dtype=float)
+    contestants = check_generator(rng).integers(0, len(fitness_values), (num_parents_to_select, k))
+    winners = np.argmax(fitness_values[contestants], axis=1)
+    return contestants[np.arange(num_parents_to_select), winners]
+
+
+if __name__ == "__main__":
+    # --- User Input Section ---
+    print("--- Genetic Algorithm: Rank-Based Selection ---")
+    while True:
+        try:
+            N = int(input("Enter the total population size (N): "))
+            if N <= 0: raise ValueError
+            break
+        except ValueError:
+            print("Invalid input. Please enter a positive integer for N.")
+
     while True:
         try:
-            label = chr(65 + i)
-            fitness = float(input(f"Fitness for Individual {label}: "))
-            if fitness < 0: raise ValueError
-            fitness_input.append(fitness)
-            original_labels_map[i] = label
+            Np = int(input(f"Enter the number of parents to select (Np <= {N}): "))
+            if Np <= 0 or Np > N: raise ValueError
             break
         except ValueError:
-            print("Invalid input. Please enter a non-negative number for fitness.")
-
-# --- Execution and Output ---
-print("\n--- Execution Result ---")
-if sum(fitness_input) == 0:
-    print("All fitness values are zero. Selection is not meaningful with this method.")
-else:
-    parents = rank_based_selection(N, Np, fitness_input)
-
-    # Print the selected parents in the requested series format
-    print(f"Selected Parent Series ({Np} parents):")
-    print(", ".join(parents))
-
-    # Detailed Output for Clarity
-    print("\n--- Selection Details ---")
-    print(f"Initial Fitnesses: {dict(zip([chr(65 + i) for i in range(N)], fitness_input))}")
-    print(f"The selection is based on rank, ensuring a more balanced selection pressure.")
-    print(f"The individuals selected for the next generation are: **{', '.join(sorted(list(set(parents))))}**")
\ No newline at end of file
+            print(f"Invalid input. Please enter a positive integer for Np, less than or equal to N ({N}).")
+
+    # Input Fitness Values
+    print(f"\nEnter the fitness value for each of the {N} individuals:")
+    fitness_input = []
+    original_labels_map = {}
+    for i in range(N):
+        while True:
+            try:
+                label = chr(65 + i)
+                fitness = float(input(f"Fitness for Individual {label}: "))
+                if fitness < 0: raise ValueError
+                fitness_input.append(fitness)
+                original_labels_map[i] = label
+                break
+            except ValueError:
+                print("Invalid input. Please enter a non-negative number for fitness.")
+
+    # --- Execution and Output ---
+    print("\n--- Execution Result ---")
+    if sum(fitness_input) == 0:
+        print("All fitness values are zero. Selection is not meaningful with this method.")
+    else:
+        parents = rank_based_selection(N, Np, fitness_input)
+
+        # Print the selected parents in the requested series format
+        print(f"Selected Parent Series ({Np} parents):")
+        print(", ".join(parents))
+
+        # Detailed Output for Clarity
+        print("\n--- Selection Details ---")
+        print(f"Initial Fitnesses: {dict(zip([chr(65 + i) for i in range(N)], fitness_input))}")
+        print(f"The selection is based on rank, ensuring a more balanced selection pressure.")
+        print(f"The individuals selected for the next generation are: **{', '.join(sorted(list(set(parents))))}**")
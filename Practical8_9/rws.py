@@ -1,6 +1,23 @@
-import random
+import numpy as np
 
-def roulette_wheel_selection(population_size, num_parents_to_select, fitness_values):
+def check_generator(rng):
+    """
+    The Generator an operator draws from: rng itself, or a fresh one for None.
+
+    Operators run many times per generation, so they take the run's
+    Generator; a seed would make every call draw the same numbers again and
+    is rejected. The GA engines accept seeds and build their Generator once.
+
+    Raises:
+        TypeError: If rng is not None or a np.random.Generator.
+    """
+    if rng is None:
+        return np.random.default_rng()
+    if not isinstance(rng, np.random.Generator):
+        raise TypeError(f"rng must be a np.random.Generator (the run's), got {type(rng).__name__}")
+    return rng
+
+def roulette_wheel_selection(population_size, num_parents_to_select, fitness_values, rng=None):
     """
     Implements the Roulette Wheel Selection method for Genetic Algorithms.
 
@@ -8,6 +25,7 @@ def roulette_wheel_selection(population_size, num_parents_to_select, fitness_val
         population_size (int): The total number of individuals in the current population (N).
         num_parents_to_select (int): The number of individuals to select as parents (Np).
         fitness_values (list): A list of fitness scores for each individual.
+        rng (np.random.Generator): Random generator; a fresh one if None.
 
     Returns:
         list: A list of selected parent labels (e.g., 'A', 'B', 'C', ...) 
@@ -33,11 +51,10 @@ def roulette_wheel_selection(population_size, num_parents_to_select, fitness_val
     labels = [chr(65 + i) for i in range(population_size)] # 65 is ASCII for 'A'
 
     # 5. Select Parents
+    # Generate all the random numbers 'r' between 0 and 1 at once
+    spins = check_generator(rng).random(num_parents_to_select) # [0.0, 1.0)
     selected_parents = []
-    for _ in range(num_parents_to_select):
-        # Generate a random number 'r' between 0 and 1
-        r = random.random() # [0.0, 1.0)
-
+    for r in spins:
         # Determine which individual's cumulative probability slice 'r' falls into
         for i, cum_p in enumerate(cumulative_probabilities):
             if r <= cum_p:
@@ -46,55 +63,293 @@ def roulette_wheel_selection(population_size, num_parents_to_select, fitness_val
 
     return selected_parents
 
-# --- User Input Section ---
-print("--- Genetic Algorithm: Roulette Wheel Selection ---")
-while True:
-    try:
-        # N: Population Size
-        N = int(input("Enter the total population size (N): "))
-        if N <= 0: raise ValueError
-        break
-    except ValueError:
-        print("Invalid input. Please enter a positive integer for N.")
-
-while True:
-    try:
-        # Np: Number of Parents to Select
-        Np = int(input(f"Enter the number of parents to select (Np <= {N}): "))
-        if Np <= 0 or Np > N: raise ValueError
-        break
-    except ValueError:
-        print(f"Invalid input. Please enter a positive integer for Np, less than or equal to N ({N}).")
-
-# Input Fitness Values
-print(f"\nEnter the fitness value for each of the {N} individuals:")
-fitness_input = []
-for i in range(N):
+def spin_wheel(cumulative, num_spins, rng):
+    """
+    Draws num_spins indices from a wheel given by cumulative weights.
+
+    The spins are sorted so searchsorted walks the wheel in order (much more
+    cache friendly for large wheels); shuffling the picks afterwards restores
+    independent draws.
+
+    Args:
+        cumulative (np.ndarray): Cumulative weights (the last entry is the total).
+        num_spins (int): The number of indices to draw.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        np.ndarray: The drawn indices, in random order.
+    """
+    r = np.sort(rng.random(num_spins)) * cumulative[-1]
+    idx = np.searchsorted(cumulative, r, side="right")
+    rng.shuffle(idx)
+    return np.minimum(idx, len(cumulative) - 1)
+
+def build_alias_table(weights):
+    """
+    Builds a Walker/Vose alias table with vectorized rounds.
+
+    Each round hands every 'small' slot (probability < 1) to the 'large' slot
+    whose cumulative surplus covers it; large slots pushed below 1 become the
+    small slots of the next round. A round is O(N) array work, but the number
+    of rounds depends on the weights: a few for near-uniform fitness, hundreds
+    for skewed (e.g. Zipf or linear) weights, so this is not O(N) overall.
+
+    Args:
+        weights (np.ndarray): Non-negative weights with a positive sum.
+
+    Returns:
+        tuple: (prob, alias) arrays of length N.
+    """
+    n = len(weights)
+    prob = weights * (n / weights.sum())
+    alias = np.arange(n)
+
+    small = np.flatnonzero(prob < 1.0)
+    large = np.flatnonzero(prob >= 1.0)
+    while small.size and large.size:
+        # Position of each small slot's deficit on the cumulative surplus axis
+        deficit_starts = np.cumsum(1.0 - prob[small]) - (1.0 - prob[small])
+        surplus_ends = np.cumsum(prob[large] - 1.0)
+        owner = np.minimum(np.searchsorted(surplus_ends, deficit_starts, side="right"), large.size - 1)
+
+        alias[small] = large[owner]
+        np.subtract.at(prob, large[owner], 1.0 - prob[small])
+
+        small = large[prob[large] < 1.0]
+        large = large[prob[large] >= 1.0]
+
+    # Leftovers are only floating-point residue
+    prob[small] = 1.0
+    prob[large] = 1.0
+    return prob, alias
+
+
+def build_fenwick(weights):
+    """
+    Builds a Fenwick (binary indexed) tree over weights in O(N).
+
+    Node i (1-based) holds the sum of the lowbit(i) weights ending at i, so it
+    is read straight off one cumulative sum instead of N point updates.
+
+    Args:
+        weights (np.ndarray): Non-negative weights.
+
+    Returns:
+        np.ndarray: The tree, of length N + 1 (entry 0 is unused).
+    """
+    cumulative = np.concatenate(([0.0], np.cumsum(weights)))
+    i = np.arange(len(cumulative))
+    tree = cumulative - cumulative[i - (i & -i)]
+    tree[0] = 0.0
+    return tree
+
+def fenwick_add(tree, indices, deltas):
+    """
+    Adds deltas to the weights at indices (0-based, no duplicates), in place.
+
+    Every index climbs its O(log N) ancestors together, one array step per level.
+    """
+    node = np.asarray(indices, dtype=np.int64) + 1
+    deltas = np.asarray(deltas, dtype=float)
+    while node.size:
+        np.add.at(tree, node, deltas)
+        node = node + (node & -node)
+        inside = node < len(tree)
+        node, deltas = node[inside], deltas[inside]
+
+def fenwick_total(tree):
+    """Sum of all weights in a Fenwick tree, in O(log N)."""
+    node, total = len(tree) - 1, 0.0
+    while node > 0:
+        total += tree[node]
+        node -= node & -node
+    return total
+
+def fenwick_spin(tree, num_spins, rng, total=None):
+    """
+    Draws num_spins indices from the wheel held in a Fenwick tree.
+
+    Each spin descends the tree from the largest power of two, O(log N) per
+    draw; as in spin_wheel the spins are sorted and the picks shuffled.
+
+    Args:
+        tree (np.ndarray): Fenwick tree from build_fenwick().
+        num_spins (int): The number of indices to draw.
+        rng (np.random.Generator): Random generator.
+        total (float): Sum of the weights; read from the tree if None.
+
+    Returns:
+        np.ndarray: The drawn indices, in random order.
+    """
+    n = len(tree) - 1
+    if total is None:
+        total = fenwick_total(tree)
+    r = np.sort(rng.random(num_spins)) * total
+    pos = np.zeros(num_spins, dtype=np.int64)
+    step = 1 << (n.bit_length() - 1) if n else 0
+    while step:
+        nxt = pos + step
+        go = nxt <= n
+        go[go] = tree[nxt[go]] <= r[go]
+        r[go] -= tree[nxt[go]]
+        pos[go] = nxt[go]
+        step >>= 1
+    rng.shuffle(pos)
+    return np.minimum(pos, n - 1)
+
+
+class RouletteWheelSelector:
+    """
+    Reusable roulette wheel for drawing many parents from the same fitness values.
+
+    Two strategies are available:
+        "alias"   Walker/Vose alias table: vectorized setup, O(1) per draw, but
+                  rebuilt (lazily) after any update.
+        "fenwick" Cumulative sums in a Fenwick tree: O(log N) per draw and
+                  O(log N) per changed individual in update().
+
+    Args:
+        fitness_values (list): A list of non-negative fitness scores for each individual.
+        method (str): Default strategy used by select().
+        rng (np.random.Generator): Random generator (or a seed) used for every draw.
+
+    Raises:
+        ValueError: If a value is negative or all values are zero.
+    """
+
+    def __init__(self, fitness_values, method="alias", rng=None):
+        self.fitness = np.array(fitness_values, dtype=float)
+        if np.any(self.fitness < 0):
+            raise ValueError("Fitness values must be non-negative for roulette wheel selection.")
+        if not np.any(self.fitness > 0):
+            raise ValueError("All fitness values are zero. Selection is not possible with this method.")
+        self.method = method
+        self.rng = np.random.default_rng(rng)
+        self.rebuild()
+
+    def rebuild(self):
+        """Rebuilds the Fenwick tree from the fitness values, in O(N)."""
+        self.tree = build_fenwick(self.fitness)
+        self.total = fenwick_total(self.tree)
+        self.positive = int(np.count_nonzero(self.fitness))
+        self.changes = 0
+        self.prob, self.alias = None, None  # alias table is built on first use
+
+    def update(self, indices, new_values):
+        """
+        Changes the fitness of some individuals.
+
+        Costs O(k log N) for k changed individuals: the differences are pushed
+        up the Fenwick tree instead of recomputing all N cumulative sums. The
+        tree is rebuilt from the fitness values once N entries have changed,
+        which keeps rounding drift bounded at O(1) amortized per change; the
+        alias table is rebuilt lazily on the next alias draw. If an index is
+        repeated, its last value wins. The selector is left unchanged if the
+        update is rejected.
+
+        Args:
+            indices (list): Indices of the individuals whose fitness changed.
+            new_values (list): Their new fitness values.
+
+        Raises:
+            ValueError: If a value is negative or the total fitness would be zero.
+        """
+        n = len(self.fitness)
+        indices = np.atleast_1d(np.asarray(indices))
+        new_values = np.broadcast_to(np.asarray(new_values, dtype=float), indices.shape)
+        if np.any(new_values < 0):
+            raise ValueError("Fitness values must be non-negative for roulette wheel selection.")
+        old_values = self.fitness[indices]  # IndexError for out-of-range indices
+        indices = np.where(indices < 0, indices + n, indices)
+        indices, last = np.unique(indices[::-1], return_index=True)
+        new_values = new_values[::-1][last]
+        old_values = self.fitness[indices]
+        positive = self.positive + int(np.count_nonzero(new_values)) - int(np.count_nonzero(old_values))
+        if positive == 0:
+            raise ValueError("All fitness values are zero. Selection is not possible with this method.")
+        self.fitness[indices] = new_values
+        self.positive = positive
+        self.changes += len(indices)
+        if self.changes >= n:
+            self.rebuild()
+            return
+        fenwick_add(self.tree, indices, new_values - old_values)
+        self.total = fenwick_total(self.tree)
+        self.prob, self.alias = None, None
+
+    def select(self, num_parents, method=None):
+        """
+        Draws num_parents individuals with probability proportional to fitness.
+
+        Args:
+            num_parents (int): The number of individuals to select (Np).
+            method (str): "alias" or "fenwick"; defaults to the selector's method.
+
+        Returns:
+            np.ndarray: Indices of the selected individuals.
+        """
+        method = method or self.method
+        if method == "alias":
+            if self.prob is None:
+                self.prob, self.alias = build_alias_table(self.fitness)
+            slots = self.rng.integers(0, len(self.fitness), num_parents)
+            keep = self.rng.random(num_parents) < self.prob[slots]
+            return np.where(keep, slots, self.alias[slots])
+        if method == "fenwick":
+            return fenwick_spin(self.tree, num_parents, self.rng, self.total)
+        raise ValueError(f"Unknown selection method: {method!r}")
+
+
+if __name__ == "__main__":
+    # --- User Input Section ---
+    print("--- Genetic Algorithm: Roulette Wheel Selection ---")
     while True:
         try:
-            # Individual labels are A, B, C...
-            label = chr(65 + i)
-            fitness = float(input(f"Fitness for Individual {label}: "))
-            if fitness < 0: raise ValueError
-            fitness_input.append(fitness)
+            # N: Population Size
+            N = int(input("Enter the total population size (N): "))
+            if N <= 0: raise ValueError
             break
         except ValueError:
-            print("Invalid input. Please enter a non-negative number for fitness.")
-
-# --- Execution and Output ---
-print("\n--- Execution Result ---")
-if sum(fitness_input) == 0:
-    print("All fitness values are zero. Selection is not possible with this method.")
-else:
-    parents = roulette_wheel_selection(N, Np, fitness_input)
-
-    # Print the selected parents in the requested series format
-    print(f"Selected Parent Series ({Np} parents):")
-    print(", ".join(parents))
-
-    # Detailed Output for Clarity
-    print("\n--- Selection Details ---")
-    print("Random values generated: {}")
-    print(f"Initial Fitnesses: {dict(zip([chr(65 + i) for i in range(N)], fitness_input))}")
-    print(f"Total Fitness: {sum(fitness_input)}")
-    print(f"The individuals selected for the next generation are: **{', '.join(sorted(list(set(parents))))}**")
\ No newline at end of file
+            print("Invalid input. Please enter a positive integer for N.")
+
+    while True:
+        try:
+            # Np: Number of Parents to Select
+            Np = int(input(f"Enter the number of parents to select (Np <= {N}): "))
+            if Np <= 0 or Np > N: raise ValueError
+            break
+        except ValueError:
+            print(f"Invalid input. Please enter a positive integer for Np, less than or equal to N ({N}).")
+
+    # Input Fitness Values
+    print(f"\nEnter the fitness value for each of the {N} individuals:")
+    fitness_input = []
+    for i in range(N):
+        while True:
+            try:
+                # Individual labels are A, B, C...
+                label = chr(65 + i)
+                fitness = float(input(f"Fitness for Individual {label}: "))
+                if fitness < 0: raise ValueError
+                fitness_input.append(fitness)
+                break
+            except ValueError:
+                print("Invalid input. Please enter a non-negative number for fitness.")
+
+    # --- Execution and Output ---
+    print("\n--- Execution Result ---")
+    if sum(fitness_input) == 0:
+        print("All fitness values are zero. Selection is not possible with this method.")
+    else:
+        parents = roulette_wheel_selection(N, Np, fitness_input)
+
+        # Print the selected parents in the requested series format
+        print(f"Selected Parent Series ({Np} parents):")
+        print(", ".join(parents))
+
+        # Detailed Output for Clarity
+        print("\n--- Selection Details ---")
+        print("Random values generated: {}")
+        print(f"Initial Fitnesses: {dict(zip([chr(65 + i) for i in range(N)], fitness_input))}")
+        print(f"Total Fitness: {sum(fitness_input)}")
+        print(f"The individuals selected for the next generation are: **{', '.join(sorted(list(set(parents))))}**")
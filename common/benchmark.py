@@ -0,0 +1,241 @@
+import csv
+import json
+import os
+import time
+import tracemalloc
+import numpy as np
+
+from Practical3.gwo import vectorized_grey_wolf_optimization
+from Practical4.csa import vectorized_crow_search_optimization
+from Practical5.aco import CandidateGraph, run_candidate_colony
+from Practical8_9.pr8 import vectorized_genetic_algorithm
+from Practical10.pr10 import ParticleSwarm
+
+# -------------------------------------------
+# Cross-algorithm benchmark suite
+# Runs every optimizer on a registry of standard test functions at several
+# dimensions and seeds, and compares the results with a stored baseline.
+# Run from the repository root:
+#
+#     python -m common.benchmark
+# -------------------------------------------
+
+# --- Test functions: each scores an (n, dim) array and returns (n,) ---
+def sphere(x):
+    return np.sum(x ** 2, axis=-1)
+
+def rastrigin(x):
+    return 10 * x.shape[-1] + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x), axis=-1)
+
+def rosenbrock(x):
+    return np.sum(100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1)
+
+def ackley(x):
+    d = x.shape[-1]
+    return (-20 * np.exp(-0.2 * np.sqrt(np.sum(x ** 2, axis=-1) / d))
+            - np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1) / d) + 20 + np.e)
+
+def griewank(x):
+    i = np.sqrt(np.arange(1, x.shape[-1] + 1))
+    return 1 + np.sum(x ** 2, axis=-1) / 4000 - np.prod(np.cos(x / i), axis=-1)
+
+def schwefel(x):
+    return 418.9829 * x.shape[-1] - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
+
+# name -> (function, lower bound, upper bound, global minimum)
+FUNCTIONS = {
+    "sphere": (sphere, -5.12, 5.12, 0.0),
+    "rastrigin": (rastrigin, -5.12, 5.12, 0.0),
+    "rosenbrock": (rosenbrock, -5.0, 10.0, 0.0),
+    "ackley": (ackley, -32.768, 32.768, 0.0),
+    "griewank": (griewank, -600.0, 600.0, 0.0),
+    "schwefel": (schwefel, -500.0, 500.0, 0.0),
+}
+
+class Probe:
+    """
+    Wraps a batch objective to count evaluations, track the best value seen
+    and note when (in seconds and evaluations) it first reached the target.
+    """
+
+    def __init__(self, func, target=None):
+        self.func = func
+        self.target = target
+        self.evaluations = 0
+        self.best = float("inf")
+        self.time_to_target = None
+        self.evals_to_target = None
+        self.start = time.perf_counter()
+
+    def __call__(self, population):
+        values = np.asarray(self.func(population), dtype=float).reshape(len(population))
+        self.record(values)
+        return values
+
+    def record(self, values):
+        self.evaluations += len(values)
+        best = values.min()
+        if best < self.best:
+            self.best = best
+            if self.time_to_target is None and self.target is not None and best <= self.target:
+                self.time_to_target = time.perf_counter() - self.start
+                self.evals_to_target = self.evaluations
+
+# --- Algorithm adapters: run(probe, dim, lb, ub, budget, rng) spends about `budget` evaluations ---
+POP_SIZE = 30
+
+def run_gwo(probe, dim, lb, ub, budget, rng=None):
+    vectorized_grey_wolf_optimization(probe, dim=dim, n_wolves=POP_SIZE, max_iter=budget // POP_SIZE, lb=lb, ub=ub,
+                                      rng=rng)
+
+def run_csa(probe, dim, lb, ub, budget, rng=None):
+    vectorized_crow_search_optimization(probe, num_crows=POP_SIZE, dim=dim, max_iter=budget // POP_SIZE - 1,
+                                        lower_bound=lb, upper_bound=ub, rng=rng)
+
+def run_pso(probe, dim, lb, ub, budget, rng=None):
+    ParticleSwarm(probe, dim=dim, num_particles=POP_SIZE, lb=lb, ub=ub, rng=rng).optimize(budget // POP_SIZE - 1)
+
+def run_ga(probe, dim, lb, ub, budget, rng=None):
+    vectorized_genetic_algorithm(pop_size=POP_SIZE, generations=budget // POP_SIZE, lb=lb, ub=ub, dim=dim, objective=probe,
+                                 rng=rng)
+
+ALGORITHMS = {"gwo": run_gwo, "csa": run_csa, "pso": run_pso, "ga": run_ga}
+
+def run_aco(probe, n_cities, budget, rng=None, n_ants=POP_SIZE, k=10):
+    # Random Euclidean tour over n_cities; one "evaluation" is one constructed tour.
+    # The colony is advanced one iteration at a time (the pheromone lives on the
+    # graph), so the probe sees the best tour of every iteration.
+    rng = np.random.default_rng(rng)
+    graph = CandidateGraph(rng.random((n_cities, 2)), k=k)
+    for _ in range(budget // n_ants):
+        _, cost = run_candidate_colony(graph, 0, 0, n_ants, 1, rng=rng)
+        probe.record(np.full(n_ants, cost))
+
+def measure(run, func, *args, target=None, track_memory=True):
+    """Runs run(Probe(func), *args) and returns its metrics."""
+    probe = Probe(func, target)
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    probe.start = start
+    run(probe, *args)
+    wall_time = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if track_memory else 0
+    if track_memory:
+        tracemalloc.stop()
+    return {
+        "best": float(probe.best),
+        "evaluations": probe.evaluations,
+        "wall_time": wall_time,
+        "evals_per_sec": probe.evaluations / wall_time if wall_time > 0 else float("inf"),
+        "peak_memory_mb": peak / 2**20,
+        "reached_target": probe.time_to_target is not None,
+        "time_to_target": probe.time_to_target,
+        "evals_to_target": probe.evals_to_target,
+    }
+
+def run_suite(algorithms=None, functions=None, dims=(2, 10), seeds=(0, 1, 2), budget_per_dim=1000,
+              tolerance=1e-4, aco_cities=(50, 200), track_memory=True):
+    """
+    Runs every algorithm on every function, dimension and seed; returns one
+    result dict per run. Timings are taken in a first run and the peak memory
+    (tracemalloc slows Python-heavy code down) in a second run with the same seed.
+    Every run gets its own np.random.default_rng(seed), so the two runs match.
+    The target is the function's global minimum + tolerance.
+    """
+    algorithms = ALGORITHMS if algorithms is None else {name: ALGORITHMS[name] for name in algorithms}
+    functions = FUNCTIONS if functions is None else {name: FUNCTIONS[name] for name in functions}
+    results = []
+
+    def run_case(name, problem, dim, seed, run, func, args, target):
+        result = measure(run, func, *args, np.random.default_rng(seed), target=target, track_memory=False)
+        if track_memory:
+            result["peak_memory_mb"] = measure(run, func, *args, np.random.default_rng(seed),
+                                               target=target)["peak_memory_mb"]
+        results.append({"algorithm": name, "function": problem, "dim": dim, "seed": seed, **result})
+
+    for name, run in algorithms.items():
+        for problem, (func, lb, ub, minimum) in functions.items():
+            for dim in dims:
+                for seed in seeds:
+                    run_case(name, problem, dim, seed, run, func, (dim, lb, ub, budget_per_dim * dim),
+                             minimum + tolerance)
+
+    # ACO solves tours rather than continuous functions; "dim" is the number of cities
+    for n_cities in aco_cities:
+        for seed in seeds:
+            run_case("aco", "tsp", n_cities, seed, run_aco, None, (n_cities, budget_per_dim * 10), None)
+    return results
+
+# --- Output and baseline comparison ---
+FIELDS = ["algorithm", "function", "dim", "seed", "best", "evaluations", "wall_time", "evals_per_sec",
+          "peak_memory_mb", "reached_target", "time_to_target", "evals_to_target"]
+
+def write_json(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=1)
+
+def write_csv(results, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def summarize(results):
+    # (algorithm, function, dim) -> median of each metric over the seeds
+    groups = {}
+    for row in results:
+        groups.setdefault((row["algorithm"], row["function"], row["dim"]), []).append(row)
+    return {key: {metric: float(np.median([row[metric] for row in rows]))
+                  for metric in ("best", "wall_time", "evals_per_sec", "peak_memory_mb")}
+            for key, rows in groups.items()}
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """
+    Compares per-configuration medians with a baseline (a list of results or
+    the path of a JSON file written by write_json). Returns the regressions:
+    throughput more than `tolerance` lower, peak memory more than `tolerance`
+    higher, or a worse median best value.
+    """
+    if isinstance(baseline, str):
+        with open(baseline) as f:
+            baseline = json.load(f)
+    current, reference = summarize(results), summarize(baseline)
+
+    regressions = []
+    for key in sorted(current.keys() & reference.keys(), key=str):
+        now, before = current[key], reference[key]
+        checks = [
+            ("evals_per_sec", now["evals_per_sec"] < (1 - tolerance) * before["evals_per_sec"]),
+            ("peak_memory_mb", now["peak_memory_mb"] > (1 + tolerance) * before["peak_memory_mb"] + 0.01),
+            ("best", now["best"] > before["best"] + 1e-12 * max(1.0, abs(before["best"]))),
+        ]
+        for metric, regressed in checks:
+            if regressed:
+                regressions.append({"algorithm": key[0], "function": key[1], "dim": key[2], "metric": metric,
+                                    "baseline": before[metric], "current": now[metric]})
+    return regressions
+
+
+if __name__ == "__main__":
+    RESULTS = "benchmark_results"
+    BASELINE = "benchmark_baseline.json"
+
+    results = run_suite()
+    write_json(results, RESULTS + ".json")
+    write_csv(results, RESULTS + ".csv")
+
+    print(f"{'algorithm':<6} {'function':<11} {'dim':>4} {'best':>12} {'evals/s':>12} {'time [s]':>9} {'peak MB':>8}")
+    for (algorithm, function, dim), s in summarize(results).items():
+        print(f"{algorithm:<6} {function:<11} {dim:>4} {s['best']:>12.4g} {s['evals_per_sec']:>12,.0f} "
+              f"{s['wall_time']:>9.3f} {s['peak_memory_mb']:>8.2f}")
+
+    if os.path.exists(BASELINE):
+        regressions = compare_to_baseline(results, BASELINE)
+        for r in regressions:
+            print(f"REGRESSION {r['algorithm']}/{r['function']}/{r['dim']} {r['metric']}: "
+                  f"{r['baseline']:.4g} -> {r['current']:.4g}")
+        print(f"{len(regressions)} regression(s) against {BASELINE}")
+    else:
+        write_json(results, BASELINE)
+        print(f"No baseline found; saved this run as {BASELINE}")
@@ -0,0 +1,147 @@
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# -------------------------------------------
+# Checkpoint / resume for long-running optimizers
+# Engines take checkpoint=None and resume=None. With a Checkpointer they call
+# checkpoint.save(iteration, state, rng) at the end of every iteration (only
+# every `every`-th call is written), and with resume=<dict from load()> they
+# restore their arrays and continue from state["iteration"]:
+#
+#     rng = np.random.default_rng(42)
+#     checkpoint = Checkpointer("gwo.ckpt.npz", every=100)
+#     grey_wolf_optimization(f, vectorized=True, rng=rng, checkpoint=checkpoint, resume=checkpoint.load(rng=rng))
+#     checkpoint.close()
+#
+# load(rng=rng) also restores the generator the engine draws from, so a
+# resumed run continues bit-for-bit like one that was never interrupted.
+# -------------------------------------------
+
+def rng_state(rng=None):
+    # JSON text of the bit generator state (the legacy global np.random when rng is None)
+    state = np.random.get_state(legacy=False) if rng is None else rng.bit_generator.state
+    return json.dumps(state, default=lambda a: a.tolist())
+
+def set_rng_state(text, rng=None):
+    state = json.loads(text)
+    if state["bit_generator"] == "MT19937":
+        state["state"]["key"] = np.array(state["state"]["key"], dtype=np.uint32)
+    if rng is None:
+        np.random.set_state(state)
+    else:
+        rng.bit_generator.state = state
+
+def write_npz(path, arrays, compress):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def write_npy_dir(path, arrays):
+    # Each snapshot is a fresh sub-directory of .npy files; the LATEST pointer
+    # is switched atomically once it is complete, then older snapshots go.
+    os.makedirs(path, exist_ok=True)
+    snapshot = f"iteration-{int(arrays['iteration'])}"
+    target = os.path.join(path, snapshot)
+    shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(target)
+    for name, value in arrays.items():
+        np.save(os.path.join(target, name + ".npy"), value)
+
+    pointer = os.path.join(path, "LATEST")
+    with open(pointer + ".tmp", "w") as f:
+        f.write(snapshot)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer + ".tmp", pointer)
+    for entry in os.listdir(path):
+        if entry.startswith("iteration-") and entry != snapshot:
+            shutil.rmtree(os.path.join(path, entry), ignore_errors=True)
+
+class Checkpointer:
+    """
+    Periodically snapshots optimizer state and writes it on a background thread.
+
+    Args:
+        path (str): A .npz file, or a directory when format="npy".
+        every (int): Write every `every`-th iteration passed to save().
+        format (str): "npz" (one compressed file) or "npy" (one .npy per
+            array, which load() memory-maps instead of reading).
+        compress (bool): Compress the .npz archive.
+
+    save() copies the arrays before returning, so the optimizer can keep
+    updating them in place while the previous snapshot is being written; at
+    most one write is in flight (a new save waits for the last one).
+    """
+
+    def __init__(self, path, every=100, format="npz", compress=True):
+        if format not in ("npz", "npy"):
+            raise ValueError(f"Unknown checkpoint format: {format!r}")
+        self.path = path
+        self.every = every
+        self.format = format
+        self.compress = compress
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.pending = None
+        self.saved = 0
+
+    def save(self, iteration, state, rng=None, force=False):
+        if iteration % self.every and not force:
+            return
+        arrays = {name: np.array(value, copy=True) for name, value in state.items() if value is not None}
+        arrays["iteration"] = np.array(iteration)
+        arrays["rng"] = np.array(rng_state(rng))
+        self.wait()
+        if self.format == "npz":
+            self.pending = self.writer.submit(write_npz, self.path, arrays, self.compress)
+        else:
+            self.pending = self.writer.submit(write_npy_dir, self.path, arrays)
+        self.saved += 1
+
+    def wait(self):
+        # Re-raises any error from the background write
+        if self.pending is not None:
+            self.pending.result()
+            self.pending = None
+
+    def exists(self):
+        if self.format == "npz":
+            return os.path.exists(self.path)
+        return os.path.exists(os.path.join(self.path, "LATEST"))
+
+    def load(self, rng=None, restore_rng=True):
+        """
+        Returns the latest state as a dict (0-d arrays become Python scalars)
+        and restores the generator state into rng (or the global np.random).
+        Returns None if nothing has been written yet.
+        """
+        self.wait()
+        if not self.exists():
+            return None
+        if self.format == "npz":
+            with np.load(self.path) as data:
+                state = {name: data[name] for name in data.files}
+        else:
+            with open(os.path.join(self.path, "LATEST")) as f:
+                snapshot = os.path.join(self.path, f.read().strip())
+            state = {entry[:-4]: np.load(os.path.join(snapshot, entry), mmap_mode="r")
+                     for entry in os.listdir(snapshot) if entry.endswith(".npy")}
+        state = {name: value.item() if value.ndim == 0 else value for name, value in state.items()}
+        if restore_rng:
+            set_rng_state(state["rng"], rng)
+        return state
+
+    def close(self):
+        self.wait()
+        self.writer.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,149 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool, resource_tracker, shared_memory
+import numpy as np
+
+# -------------------------------------------
+# Pluggable evaluation backends
+# An evaluator wraps an objective and scores a whole population per call, so
+# it can be passed wherever an optimizer expects a batch objective:
+#
+#     with ProcessPoolEvaluator(objective_function, processes=8) as evaluate:
+#         grey_wolf_optimization(evaluate, dim=30, vectorized=True)
+#
+# func scores a single point unless batch=True, in which case it is called
+# with an (n, ...) chunk and must return n values.
+#
+# Only the engines that score their whole population in one call benefit:
+# vectorized_grey_wolf_optimization, vectorized_crow_search_optimization,
+# vectorized_genetic_algorithm and ParticleSwarm (mode="sync"). The loop
+# versions call their objective once per individual, so an evaluator there
+# only counts evaluations; fo.py's steady_state_ga takes an executor through
+# async_evaluator instead.
+# -------------------------------------------
+
+def evaluate_chunk(func, chunk, batch):
+    if batch:
+        return np.asarray(func(chunk), dtype=float).reshape(len(chunk))
+    return np.array([func(x) for x in chunk], dtype=float)
+
+def chunk_bounds(n, n_chunks):
+    edges = np.linspace(0, n, min(n, n_chunks) + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+class SerialEvaluator:
+    """Evaluates every point in the calling process."""
+
+    def __init__(self, func, point_ndim=1, batch=False):
+        self.func = func
+        self.point_ndim = point_ndim
+        self.batch = batch
+        self.evaluations = 0
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim == self.point_ndim:
+            return self.evaluate(x[None])[0]
+        return self.evaluate(x)
+
+    def evaluate(self, population):
+        self.evaluations += len(population)
+        return evaluate_chunk(self.func, population, self.batch)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ThreadPoolEvaluator(SerialEvaluator):
+    """Splits the population into chunks scored on a thread pool (for objectives that release the GIL)."""
+
+    def __init__(self, func, point_ndim=1, batch=False, threads=None, chunks_per_worker=4):
+        super().__init__(func, point_ndim, batch)
+        self.threads = threads or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.pool = ThreadPoolExecutor(self.threads)
+
+    def evaluate(self, population):
+        self.evaluations += len(population)
+        bounds = chunk_bounds(len(population), self.threads * self.chunks_per_worker)
+        parts = self.pool.map(lambda b: evaluate_chunk(self.func, population[b[0]:b[1]], self.batch), bounds)
+        return np.concatenate(list(parts)) if bounds else np.empty(0)
+
+    def close(self):
+        self.pool.shutdown()
+
+# Per-worker state of ProcessPoolEvaluator: the objective and the attached shared block
+worker_state = {}
+
+def init_evaluator_worker(func, batch):
+    worker_state["func"] = func
+    worker_state["batch"] = batch
+    worker_state["shm"] = None
+
+def attach_shared_block(name):
+    # The creating process owns the block and unlinks it; workers only attach,
+    # so they must not register it with the resource tracker as well
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+def evaluate_shared_chunk(task):
+    name, shape, start, stop = task
+    shm = worker_state["shm"]
+    if shm is None or shm.name != name:
+        if shm is not None:
+            shm.close()
+        shm = worker_state["shm"] = attach_shared_block(name)
+    population = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    return evaluate_chunk(worker_state["func"], population[start:stop], worker_state["batch"])
+
+class ProcessPoolEvaluator(SerialEvaluator):
+    """
+    Scores chunks of the population in worker processes.
+
+    The objective is sent to each worker once (it must be picklable) and the
+    population is copied into a shared-memory block that workers read in
+    place, so only (start, stop) bounds and the result values cross process
+    boundaries. The block is reused across calls and grown when needed.
+    """
+
+    def __init__(self, func, point_ndim=1, batch=False, processes=None, chunks_per_worker=4):
+        super().__init__(func, point_ndim, batch)
+        self.processes = processes or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.pool = Pool(self.processes, initializer=init_evaluator_worker, initargs=(func, batch))
+        self.shm = None
+
+    def evaluate(self, population):
+        population = np.ascontiguousarray(population, dtype=float)
+        self.evaluations += len(population)
+        if len(population) == 0:
+            return np.empty(0)
+
+        if self.shm is None or self.shm.size < population.nbytes:
+            self.release_block()
+            self.shm = shared_memory.SharedMemory(create=True, size=population.nbytes)
+        np.ndarray(population.shape, dtype=float, buffer=self.shm.buf)[:] = population
+
+        bounds = chunk_bounds(len(population), self.processes * self.chunks_per_worker)
+        tasks = [(self.shm.name, population.shape, start, stop) for start, stop in bounds]
+        return np.concatenate(self.pool.map(evaluate_shared_chunk, tasks))
+
+    def release_block(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.release_block()
@@ -0,0 +1,126 @@
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# -------------------------------------------
+# Shared fitness-evaluation cache
+# Wrap an objective once and pass the wrapper to any optimizer that takes
+# its objective as a callable (gwo, csa, pr8 and ParticleSwarm in pr10; fo's
+# steady_state_ga takes it through async_evaluator):
+#
+#     cached = FitnessCache(objective_function, point_ndim=1, resolution=1e-9)
+#     grey_wolf_optimization(cached, dim=2, vectorized=True)
+#     print(cached.stats())
+# -------------------------------------------
+
+class FitnessCache:
+    """
+    Memoizes an objective on quantized positions with LRU eviction.
+
+    Args:
+        func (callable): The objective. With batch=True it is called once with
+            an (n_misses, ...) array of all uncached points; otherwise once per point.
+        point_ndim (int): Dimensions of a single point (0 for scalar objectives
+            like pr8/fo/pr10, 1 for vector ones like gwo/csa). Inputs with more
+            dimensions are treated as a batch along the first axis.
+        resolution (float): Positions are rounded to multiples of this before
+            lookup, so points closer than the resolution share one entry.
+        maxsize (int): Maximum number of cached entries (None for unbounded).
+        path (str): Optional .npz file loaded on creation and written by save().
+        batch (bool): Whether func accepts a batch of points.
+    """
+
+    def __init__(self, func, point_ndim=1, resolution=1e-9, maxsize=1_000_000, path=None, batch=False):
+        self.func = func
+        self.point_ndim = point_ndim
+        self.resolution = resolution
+        self.maxsize = maxsize
+        self.path = path
+        self.batch = batch
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def quantize(self, points):
+        # (n, ...) positions -> n hashable keys (raw bytes of the rounded grid index)
+        grid = np.round(np.asarray(points, dtype=float) / self.resolution).astype(np.int64)
+        grid = np.ascontiguousarray(grid.reshape(len(grid), -1))
+        return grid.view(np.dtype((np.void, grid.shape[1] * 8))).ravel().tolist()
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim == self.point_ndim:
+            return self.evaluate(x[None])[0]
+        return self.evaluate(x)
+
+    def evaluate(self, points):
+        """Returns the objective of every point in an (n, ...) array, computing only the misses."""
+        keys = self.quantize(points)
+        values = np.empty(len(keys))
+
+        # Misses are grouped by key so duplicates inside one batch are computed once
+        missing = {}
+        with self.lock:
+            for i, key in enumerate(keys):
+                value = self.entries.get(key)
+                if value is None:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self.entries.move_to_end(key)
+                    values[i] = value
+            self.hits += len(keys) - sum(len(idx) for idx in missing.values())
+            self.misses += len(missing)
+
+        if missing:
+            first = [idx[0] for idx in missing.values()]
+            if self.batch:
+                computed = np.asarray(self.func(points[first]), dtype=float).reshape(len(first))
+            else:
+                computed = np.array([self.func(points[i]) for i in first], dtype=float)
+
+            with self.lock:
+                for (key, idx), value in zip(missing.items(), computed):
+                    values[idx] = value
+                    self.entries[key] = value
+                    self.entries.move_to_end(key)
+                while self.maxsize is not None and len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return values
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries),
+                "hit_rate": self.hits / total if total else 0.0}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def save(self, path=None):
+        """Writes all entries to a .npz file (atomically, via a temporary file)."""
+        path = path or self.path
+        with self.lock:
+            keys = list(self.entries)
+            values = np.fromiter(self.entries.values(), dtype=float, count=len(keys))
+        grid = np.frombuffer(b"".join(keys), dtype=np.int64).reshape(len(keys), -1)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, grid=grid, values=values, resolution=self.resolution)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """Adds the entries of a file written by save() (its resolution must match)."""
+        data = np.load(path)
+        if not np.isclose(data["resolution"], self.resolution):
+            raise ValueError(f"cache file {path} was written with resolution {data['resolution']}")
+        grid = np.ascontiguousarray(data["grid"], dtype=np.int64)
+        keys = grid.view(np.dtype((np.void, grid.shape[1] * 8))).ravel().tolist() if len(grid) else []
+        with self.lock:
+            for key, value in zip(keys, data["values"].tolist()):
+                self.entries[key] = value
+            while self.maxsize is not None and len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
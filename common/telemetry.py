@@ -0,0 +1,143 @@
+import json
+import os
+import time
+import numpy as np
+
+# -------------------------------------------
+# Convergence telemetry
+# Optimizers take telemetry=None and, when one is given, call
+#
+#     telemetry.observe(iteration, best, population, fitness, evaluations)
+#
+# once per iteration. With telemetry=None that is a single `is not None`
+# check per iteration: nothing is formatted, printed or stored.
+#
+#     with Telemetry(every=10, sinks=[NpySink("gwo.npy")]) as telemetry:
+#         grey_wolf_optimization(objective_function, vectorized=True, telemetry=telemetry)
+# -------------------------------------------
+
+FIELDS = ("iteration", "best", "mean", "diversity", "evaluations", "time")
+
+def population_diversity(population):
+    # Mean Euclidean distance of the individuals to the population centroid
+    population = np.asarray(population, dtype=float).reshape(len(population), -1)
+    return np.sqrt(((population - population.mean(axis=0)) ** 2).sum(axis=1)).mean()
+
+class Telemetry:
+    """
+    Preallocated ring buffer of per-iteration metrics (one row per FIELDS).
+
+    Only every `every`-th iteration is recorded, and mean/diversity are only
+    computed for recorded iterations. Without sinks the buffer keeps the
+    latest `capacity` rows; with sinks it is handed to them in one block
+    whenever it fills up, and on flush()/close().
+    """
+
+    def __init__(self, capacity=1024, every=1, sinks=()):
+        self.buffer = np.full((capacity, len(FIELDS)), np.nan)
+        self.capacity = capacity
+        self.every = every
+        self.sinks = list(sinks)
+        self.total = 0     # rows ever recorded
+        self.flushed = 0   # rows already handed to the sinks
+        self.start = time.perf_counter()
+
+    def observe(self, iteration, best, population=None, fitness=None, evaluations=np.nan):
+        if iteration % self.every:
+            return
+        row = self.buffer[self.total % self.capacity]
+        row[0] = iteration
+        row[1] = best
+        row[2] = np.mean(fitness) if fitness is not None else np.nan
+        row[3] = population_diversity(population) if population is not None else np.nan
+        row[4] = evaluations
+        row[5] = time.perf_counter() - self.start
+        self.total += 1
+        if self.sinks and self.total - self.flushed == self.capacity:
+            self.flush()
+
+    def history(self):
+        """The buffered rows (at most the latest `capacity`) in recording order."""
+        n = min(self.total, self.capacity)
+        return np.roll(self.buffer, -(self.total % self.capacity), axis=0)[-n:] if n else self.buffer[:0].copy()
+
+    def flush(self):
+        pending = self.total - self.flushed
+        if pending and self.sinks:
+            rows = self.history()[-pending:]
+            for sink in self.sinks:
+                sink.write(rows)
+        self.flushed = self.total
+
+    def close(self):
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# --- Sinks: write(rows) receives an (n, len(FIELDS)) block, close() finishes the output ---
+class MemorySink:
+    def __init__(self):
+        self.blocks = []
+
+    def write(self, rows):
+        self.blocks.append(rows.copy())
+
+    def data(self):
+        return np.concatenate(self.blocks) if self.blocks else np.empty((0, len(FIELDS)))
+
+    def close(self):
+        pass
+
+class NpySink:
+    """Streams rows to a raw side file and turns it into a (rows, len(FIELDS)) .npy on close."""
+
+    def __init__(self, path):
+        self.path = path
+        self.part = path + ".part"
+        self.file = open(self.part, "wb")
+        self.rows = 0
+
+    def write(self, rows):
+        np.ascontiguousarray(rows, dtype=float).tofile(self.file)
+        self.rows += len(rows)
+
+    def close(self):
+        self.file.close()
+        out = np.lib.format.open_memmap(self.path, mode="w+", dtype=float, shape=(self.rows, len(FIELDS)))
+        if self.rows:
+            out[:] = np.memmap(self.part, dtype=float, mode="r", shape=(self.rows, len(FIELDS)))
+        out.flush()
+        del out
+        os.remove(self.part)
+
+class JsonLinesSink:
+    """One JSON object per row (missing metrics are written as null)."""
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+
+    def write(self, rows):
+        for row in rows.tolist():
+            record = {name: (None if value != value else value) for name, value in zip(FIELDS, row)}
+            self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self.file.close()
+
+class ConsoleSink:
+    """Prints the recorded rows, e.g. for demos that used to print every iteration
+    (rows arrive when the buffer fills, so use a small capacity for live output)."""
+
+    def write(self, rows):
+        for iteration, best, mean, diversity, evaluations, elapsed in rows.tolist():
+            print(f"Iteration {int(iteration) + 1} | Best: {best:.6f} | Mean: {mean:.6f} | "
+                  f"Diversity: {diversity:.4f} | Evaluations: {evaluations:.0f} | {elapsed:.3f}s")
+
+    def close(self):
+        pass
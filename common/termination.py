@@ -0,0 +1,98 @@
+import time
+import numpy as np
+
+from common.telemetry import population_diversity
+
+# -------------------------------------------
+# Budget-aware termination
+# Optimizers take termination=None and, when one is given, call
+#
+#     if termination.update(iteration, best, population, evaluations):
+#         break
+#
+# once per iteration, after recording it, and termination.reset() when the
+# run starts, so one object can be reused across runs. The loop bound (max_iter,
+# generations, ...) stays as a hard cap; any enabled criterion can end the
+# run earlier, and termination.reason says which one did:
+#
+#     termination = Termination(max_evaluations=5000, target=1e-6, window=20, tolerance=1e-9)
+#     grey_wolf_optimization(objective_function, max_iter=10_000, vectorized=True, termination=termination)
+#     print(termination.reason, termination.iteration)
+# -------------------------------------------
+
+CRITERIA = ("target", "max_evaluations", "time_limit", "stagnation", "diversity")
+
+class Termination:
+    """
+    Stops a run as soon as any enabled criterion (checked in CRITERIA order) fires.
+
+    Args:
+        max_evaluations (int): Objective evaluations the run may spend.
+        time_limit (float): Wall-clock seconds since the run started (reset()).
+        target (float): Stop once the best value reaches it.
+        window (int): Stagnation window; stop when the best value improved
+            by less than `tolerance` over the last `window` iterations.
+        tolerance (float): Minimum improvement over the window.
+        min_diversity (float): Stop when the population's mean distance to
+            its centroid falls below it (checked every `diversity_every`
+            iterations, as it is the only O(population) criterion).
+        maximize (bool): The engine reports a best value to maximize.
+
+    Every other criterion costs O(1) per iteration: the running best and a
+    ring buffer of its last `window` values are all that is kept.
+    After a stop, reason, iteration, evaluations and elapsed describe it,
+    and update() raises until reset() starts the next run.
+    """
+
+    def __init__(self, max_evaluations=None, time_limit=None, target=None, window=None, tolerance=1e-8,
+                 min_diversity=None, diversity_every=1, maximize=False):
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+        self.target = target
+        self.window = window
+        self.tolerance = tolerance
+        self.min_diversity = min_diversity
+        self.diversity_every = diversity_every
+        self.sign = -1.0 if maximize else 1.0
+        self.recent = np.empty(window) if window else None
+        self.reset()
+
+    def reset(self):
+        """Restarts the clock and forgets the previous run."""
+        self.start = time.perf_counter()
+        self.best = float("inf")   # running best, as a value to minimize
+        self.updates = 0
+        self.reason = self.iteration = self.evaluations = self.elapsed = None
+
+    def stop(self, reason, iteration, evaluations):
+        self.reason, self.iteration, self.evaluations = reason, iteration, evaluations
+        self.elapsed = time.perf_counter() - self.start
+        return True
+
+    def update(self, iteration, best, population=None, evaluations=None):
+        """Records one iteration; returns True when the run should stop."""
+        if self.reason is not None:
+            raise RuntimeError(f"Termination already fired ({self.reason}); call reset() before the next run")
+        self.best = min(self.best, self.sign * float(best))
+        improvement = float("inf")
+        if self.window:
+            # recent[slot] is the running best `window` updates ago
+            slot = self.updates % self.window
+            if self.updates >= self.window:
+                improvement = self.recent[slot] - self.best
+            self.recent[slot] = self.best
+        self.updates += 1
+
+        if self.target is not None and self.best <= self.sign * self.target:
+            return self.stop("target", iteration, evaluations)
+        if self.max_evaluations is not None and evaluations is not None and evaluations >= self.max_evaluations:
+            return self.stop("max_evaluations", iteration, evaluations)
+        if self.time_limit is not None and time.perf_counter() - self.start >= self.time_limit:
+            return self.stop("time_limit", iteration, evaluations)
+
+        if improvement < self.tolerance:
+            return self.stop("stagnation", iteration, evaluations)
+        if (self.min_diversity is not None and population is not None and iteration % self.diversity_every == 0
+                and population_diversity(population) < self.min_diversity):
+            return self.stop("diversity", iteration, evaluations)
+        return False